@@ -256,6 +256,7 @@ def _amend_sequence_container(
                 )
 
         sequence_container = _normalize_length_of_sequence_container(
+            sequence_container_type=sequence_container_type,
             sequence_container=sequence_container,
             proposed_length_change=proposed_length_changes,
             padding_value=padding_value,
@@ -7,16 +7,19 @@ from amend.testing.unit import (
     TestAmendFile,
     TestAmendImmutableBinary,
     TestAmendImmutableDataSet,
+    TestAmendImmutableSequence,
     TestAmendInteger,
     TestAmendMutableBinary,
     TestAmendMutableDataMapping,
     TestAmendMutableDataSet,
+    TestAmendMutableSequence,
     TestAmendRealNumber,
     TestAmendTemporalOffset,
     TestAmendText,
     TestAmendTime,
     TestImmutableMappingAcquisition,
     TestLeastCommonMultiplierSearch,
+    TestLengthIteration,
     TestLengthNormalizationOfImmutableBinary,
     TestLengthNormalizationOfImmutableSequence,
     TestLengthNormalizationOfMutableBinary,
@@ -3,10 +3,12 @@ import unittest
 from amend.testing.unit.built_in import (
     TestAmendImmutableBinary,
     TestAmendImmutableDataSet,
+    TestAmendImmutableSequence,
     TestAmendInteger,
     TestAmendMutableBinary,
     TestAmendMutableDataMapping,
     TestAmendMutableDataSet,
+    TestAmendMutableSequence,
     TestAmendRealNumber,
     TestAmendText,
 )
@@ -21,6 +23,7 @@ from amend.testing.unit.standard import (
 from amend.testing.unit.utilities import (
     TestImmutableMappingAcquisition,
     TestLeastCommonMultiplierSearch,
+    TestLengthIteration,
     TestLengthNormalizationOfImmutableBinary,
     TestLengthNormalizationOfImmutableSequence,
     TestLengthNormalizationOfMutableBinary,
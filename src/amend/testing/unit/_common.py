@@ -0,0 +1,89 @@
+# Copyright 2025 Miljenko Šuflaj
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+from typing import (
+    Any,
+    Callable,
+    Sequence,
+)
+import unittest
+
+
+def assert_cast_error(
+    test_case: unittest.TestCase,
+    function: Callable[..., Any],
+    argument_name: str,
+    valid_value_on_cast_error: Any,
+    invalid_value_on_cast_error: Any,
+):
+    # NOTE: None is the uncastable value for every amendment this is used for.
+    test_case.assertRaises(
+        TypeError,
+        function,
+        **{argument_name: None},
+    )
+    test_case.assertRaises(
+        ValueError,
+        function,
+        **{
+            argument_name: None,
+            "value_on_cast_error": invalid_value_on_cast_error,
+        },
+    )
+
+    result = function(
+        **{
+            argument_name: None,
+            "value_on_cast_error": valid_value_on_cast_error,
+        }
+    )
+    # NOTE: The value on cast error is returned as-is, not a copy or a cast of it.
+    test_case.assertIs(
+        result,
+        valid_value_on_cast_error,
+    )
+
+
+def assert_sequences_almost_equal(
+    test_case: unittest.TestCase,
+    first: Sequence[Any],
+    second: Sequence[Any],
+):
+    # NOTE: assertAlmostEqual only compares sequences with ==, so floats are compared
+    # element by element here instead.
+    test_case.assertIs(
+        type(first),
+        type(second),
+    )
+    test_case.assertEqual(
+        len(first),
+        len(second),
+    )
+
+    for index, (first_element, second_element) in enumerate(zip(first, second)):
+        if isinstance(second_element, float):
+            test_case.assertTrue(
+                math.isclose(
+                    first_element,
+                    second_element,
+                ),
+                f"Element {index} isn't close enough",
+            )
+        else:
+            test_case.assertEqual(
+                first_element,
+                second_element,
+                f"Element {index} differs",
+            )
@@ -7,7 +7,9 @@ from amend.testing.unit.built_in.numbers import (
 )
 from amend.testing.unit.built_in.sequences import (
     TestAmendImmutableBinary,
+    TestAmendImmutableSequence,
     TestAmendMutableBinary,
+    TestAmendMutableSequence,
     TestAmendText,
 )
 from amend.testing.unit.built_in.sets import (
@@ -21,18 +21,12 @@ class TestAmendMutableDataMapping(unittest.TestCase):
     def test_no_amendment_needed(
         self,
     ):
-        try:
-            amend_mutable_data_mapping(
-                mutable_data_mapping={
-                    "a": 1,
-                    "b": 2,
-                }
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_mutable_data_mapping(
+            mutable_data_mapping={
+                "a": 1,
+                "b": 2,
+            }
+        )
 
     def test_type_mismatch(
         self,
@@ -46,13 +40,7 @@ class TestAmendMutableDataMapping(unittest.TestCase):
             "b": 2,
         }
 
-        try:
-            result = amend_mutable_data_mapping(mutable_data_mapping=data_mapping)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_mutable_data_mapping(mutable_data_mapping=data_mapping)
         self.assertEqual(
             result,
             expected_result,
@@ -95,19 +83,13 @@ class TestAmendMutableDataMapping(unittest.TestCase):
             ),
         )
 
-        try:
-            result = amend_mutable_data_mapping(
-                mutable_data_mapping=None,
-                value_on_cast_error=(
-                    ("a", 1),
-                    ("b", 2),
-                ),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
+        result = amend_mutable_data_mapping(
+            mutable_data_mapping=None,
+            value_on_cast_error=(
+                ("a", 1),
+                ("b", 2),
+            ),
+        )
 
         self.assertEqual(
             result,
@@ -125,40 +107,22 @@ class TestAmendMutableDataMapping(unittest.TestCase):
             "b": 2,
         }
 
-        try:
-            amend_mutable_data_mapping(
-                mutable_data_mapping=data_mapping,
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation without defined limits: {e}",
-            )
-
-        try:
-            amend_mutable_data_mapping(
-                mutable_data_mapping=data_mapping,
-                minimum_length=0,
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation with minimum 0 length: {e}",
-            )
-
-        try:
-            amend_mutable_data_mapping(
-                mutable_data_mapping=data_mapping,
-                maximum_length=len(data_mapping),
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                "Threw exception for length violation with exact maximum length",
-            )
+        amend_mutable_data_mapping(
+            mutable_data_mapping=data_mapping,
+            length_violation_action="error",
+        )
+
+        amend_mutable_data_mapping(
+            mutable_data_mapping=data_mapping,
+            minimum_length=0,
+            length_violation_action="error",
+        )
+
+        amend_mutable_data_mapping(
+            mutable_data_mapping=data_mapping,
+            maximum_length=len(data_mapping),
+            length_violation_action="error",
+        )
 
         self.assertRaises(
             ValueError,
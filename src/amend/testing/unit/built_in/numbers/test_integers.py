@@ -19,13 +19,7 @@ from amend.built_in.numbers.integers import amend_integer
 
 class TestAmendInteger(unittest.TestCase):
     def test_no_amendment_needed(self):
-        try:
-            amend_integer(integer=0)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_integer(integer=0)
 
     def test_type_mismatch(
         self,
@@ -33,13 +27,7 @@ class TestAmendInteger(unittest.TestCase):
         integer = "0"
         expected_result = 0
 
-        try:
-            result = amend_integer(integer=integer)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_integer(integer=integer)
         self.assertEqual(
             result,
             expected_result,
@@ -69,16 +57,10 @@ class TestAmendInteger(unittest.TestCase):
             value_on_cast_error="a",
         )
 
-        try:
-            result = amend_integer(
-                integer=None,
-                value_on_cast_error=value_on_cast_error,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
+        result = amend_integer(
+            integer=None,
+            value_on_cast_error=value_on_cast_error,
+        )
 
         self.assertEqual(
             result,
@@ -88,40 +70,22 @@ class TestAmendInteger(unittest.TestCase):
     def test_value_violation(
         self,
     ):
-        try:
-            amend_integer(
-                integer=0,
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation without defined limits: {e}",
-            )
-
-        try:
-            amend_integer(
-                integer=0,
-                minimum_value=0,
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation with exact minimum: {e}",
-            )
-
-        try:
-            amend_integer(
-                integer=0,
-                maximum_value=0,
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation with exact maximum: {e}",
-            )
+        amend_integer(
+            integer=0,
+            value_violation_action="error",
+        )
+
+        amend_integer(
+            integer=0,
+            minimum_value=0,
+            value_violation_action="error",
+        )
+
+        amend_integer(
+            integer=0,
+            maximum_value=0,
+            value_violation_action="error",
+        )
 
         self.assertRaises(
             ValueError,
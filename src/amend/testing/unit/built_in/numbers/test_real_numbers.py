@@ -19,13 +19,7 @@ from amend.built_in.numbers.real_numbers import amend_real_number
 
 class TestAmendRealNumber(unittest.TestCase):
     def test_no_amendment_needed(self):
-        try:
-            amend_real_number(real_number=0.0)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_real_number(real_number=0.0)
 
     def test_type_mismatch(
         self,
@@ -33,13 +27,7 @@ class TestAmendRealNumber(unittest.TestCase):
         real_number = "0"
         expected_result = 0
 
-        try:
-            result = amend_real_number(real_number=real_number)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_real_number(real_number=real_number)
 
         self.assertEqual(
             result,
@@ -70,16 +58,10 @@ class TestAmendRealNumber(unittest.TestCase):
             value_on_cast_error="a",
         )
 
-        try:
-            result = amend_real_number(
-                real_number=None,
-                value_on_cast_error=value_on_cast_error,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
+        result = amend_real_number(
+            real_number=None,
+            value_on_cast_error=value_on_cast_error,
+        )
 
         self.assertAlmostEqual(
             result,
@@ -89,40 +71,22 @@ class TestAmendRealNumber(unittest.TestCase):
     def test_value_violation(
         self,
     ):
-        try:
-            amend_real_number(
-                real_number=0,
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation without defined limits: {e}",
-            )
+        amend_real_number(
+            real_number=0,
+            value_violation_action="error",
+        )
 
-        try:
-            amend_real_number(
-                real_number=0.0,
-                minimum_value=0.0,
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation with exact minimum: {e}",
-            )
+        amend_real_number(
+            real_number=0.0,
+            minimum_value=0.0,
+            value_violation_action="error",
+        )
 
-        try:
-            amend_real_number(
-                real_number=0.0,
-                maximum_value=0.0,
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation with exact maximum: {e}",
-            )
+        amend_real_number(
+            real_number=0.0,
+            maximum_value=0.0,
+            value_violation_action="error",
+        )
 
         self.assertRaises(
             ValueError,
@@ -142,26 +106,14 @@ class TestAmendRealNumber(unittest.TestCase):
     def test_infinite_value(
         self,
     ):
-        try:
-            amend_real_number(
-                real_number=0.0,
-                infinite_value_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for infinite value for finite value: {e}",
-            )
-        try:
-            amend_real_number(
-                real_number=float("nan"),
-                infinite_value_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for infinite value for non-a-number: {e}",
-            )
+        amend_real_number(
+            real_number=0.0,
+            infinite_value_action="error",
+        )
+        amend_real_number(
+            real_number=float("nan"),
+            infinite_value_action="error",
+        )
 
         self.assertRaises(
             ValueError,
@@ -185,47 +137,23 @@ class TestAmendRealNumber(unittest.TestCase):
     def test_not_a_number_value(
         self,
     ):
-        try:
-            amend_real_number(
-                real_number=0.0,
-                not_a_number_value_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for not-a-number value for number: {e}",
-            )
+        amend_real_number(
+            real_number=0.0,
+            not_a_number_value_action="error",
+        )
 
-        try:
-            amend_real_number(
-                real_number=float("inf"),
-                not_a_number_value_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for not-a-number value for infinity: {e}",
-            )
-        try:
-            amend_real_number(
-                real_number=float("+inf"),
-                not_a_number_value_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for not-a-number value for positive infinity: {e}",
-            )
-        try:
-            amend_real_number(
-                real_number=float("-inf"),
-                not_a_number_value_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for not-a-number value for negative infinity: {e}",
-            )
+        amend_real_number(
+            real_number=float("inf"),
+            not_a_number_value_action="error",
+        )
+        amend_real_number(
+            real_number=float("+inf"),
+            not_a_number_value_action="error",
+        )
+        amend_real_number(
+            real_number=float("-inf"),
+            not_a_number_value_action="error",
+        )
 
         self.assertRaises(
             ValueError,
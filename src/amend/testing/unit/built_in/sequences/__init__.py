@@ -5,6 +5,10 @@ from amend.testing.unit.built_in.sequences.test_data_sequences import (
     TestAmendMutableBinary,
     TestAmendText,
 )
+from amend.testing.unit.built_in.sequences.test_sequence_containers import (
+    TestAmendImmutableSequence,
+    TestAmendMutableSequence,
+)
 
 if __name__ == "__main__":
     unittest.main()
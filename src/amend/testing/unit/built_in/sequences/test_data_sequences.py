@@ -25,13 +25,7 @@ class TestAmendImmutableBinary(unittest.TestCase):
     def test_no_amendment_needed(
         self,
     ):
-        try:
-            amend_immutable_binary(immutable_binary=b"")
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_immutable_binary(immutable_binary=b"")
 
     def test_type_mismatch(
         self,
@@ -39,13 +33,7 @@ class TestAmendImmutableBinary(unittest.TestCase):
         immutable_binary = bytearray(b"0")
         expected_result = b"0"
 
-        try:
-            result = amend_immutable_binary(immutable_binary=immutable_binary)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_immutable_binary(immutable_binary=immutable_binary)
 
         self.assertEqual(
             result,
@@ -76,16 +64,10 @@ class TestAmendImmutableBinary(unittest.TestCase):
             value_on_cast_error=(0,),
         )
 
-        try:
-            result = amend_immutable_binary(
-                immutable_binary=None,
-                value_on_cast_error=value_on_cast_error,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
+        result = amend_immutable_binary(
+            immutable_binary=None,
+            value_on_cast_error=value_on_cast_error,
+        )
 
         self.assertEqual(
             result,
@@ -97,40 +79,22 @@ class TestAmendImmutableBinary(unittest.TestCase):
     ):
         immutable_binary = b"01"
 
-        try:
-            amend_immutable_binary(
-                immutable_binary=immutable_binary,
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation without defined limits: {e}",
-            )
-
-        try:
-            amend_immutable_binary(
-                immutable_binary=immutable_binary,
-                minimum_length=0,
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation with minimum 0 length: {e}",
-            )
-
-        try:
-            amend_immutable_binary(
-                immutable_binary=immutable_binary,
-                maximum_length=len(immutable_binary),
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation with exact length maximum: {e}",
-            )
+        amend_immutable_binary(
+            immutable_binary=immutable_binary,
+            length_violation_action="error",
+        )
+
+        amend_immutable_binary(
+            immutable_binary=immutable_binary,
+            minimum_length=0,
+            length_violation_action="error",
+        )
+
+        amend_immutable_binary(
+            immutable_binary=immutable_binary,
+            maximum_length=len(immutable_binary),
+            length_violation_action="error",
+        )
 
         self.assertRaises(
             ValueError,
@@ -152,13 +116,7 @@ class TestAmendMutableBinary(unittest.TestCase):
     def test_no_amendment_needed(
         self,
     ):
-        try:
-            amend_mutable_binary(mutable_binary=bytearray(b""))
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_mutable_binary(mutable_binary=bytearray(b""))
 
     def test_type_mismatch(
         self,
@@ -166,13 +124,7 @@ class TestAmendMutableBinary(unittest.TestCase):
         mutable_binary = b"0"
         expected_result = bytearray(mutable_binary)
 
-        try:
-            result = amend_mutable_binary(mutable_binary=mutable_binary)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_mutable_binary(mutable_binary=mutable_binary)
 
         self.assertEqual(
             result,
@@ -203,16 +155,10 @@ class TestAmendMutableBinary(unittest.TestCase):
             value_on_cast_error=(0,),
         )
 
-        try:
-            result = amend_mutable_binary(
-                mutable_binary=None,
-                value_on_cast_error=value_on_cast_error,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
+        result = amend_mutable_binary(
+            mutable_binary=None,
+            value_on_cast_error=value_on_cast_error,
+        )
 
         self.assertEqual(
             result,
@@ -224,40 +170,22 @@ class TestAmendMutableBinary(unittest.TestCase):
     ):
         mutable_binary = bytearray(b"01")
 
-        try:
-            amend_mutable_binary(
-                mutable_binary=mutable_binary,
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation without defined limits: {e}",
-            )
-
-        try:
-            amend_mutable_binary(
-                mutable_binary=mutable_binary,
-                minimum_length=0,
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation with minimum 0 length: {e}",
-            )
-
-        try:
-            amend_mutable_binary(
-                mutable_binary=mutable_binary,
-                maximum_length=len(mutable_binary),
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation with exact length maximum: {e}",
-            )
+        amend_mutable_binary(
+            mutable_binary=mutable_binary,
+            length_violation_action="error",
+        )
+
+        amend_mutable_binary(
+            mutable_binary=mutable_binary,
+            minimum_length=0,
+            length_violation_action="error",
+        )
+
+        amend_mutable_binary(
+            mutable_binary=mutable_binary,
+            maximum_length=len(mutable_binary),
+            length_violation_action="error",
+        )
 
         self.assertRaises(
             ValueError,
@@ -283,13 +211,7 @@ class TestAmendText(unittest.TestCase):
     def test_no_amendment_needed(
         self,
     ):
-        try:
-            amend_text(text="")
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_text(text="")
 
     def test_type_mismatch(
         self,
@@ -297,13 +219,7 @@ class TestAmendText(unittest.TestCase):
         text = 0
         expected_result = "0"
 
-        try:
-            result = amend_text(text=text)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_text(text=text)
 
         self.assertEqual(
             result,
@@ -334,16 +250,10 @@ class TestAmendText(unittest.TestCase):
             value_on_cast_error=(0,),
         )
 
-        try:
-            result = amend_text(
-                text=self.BadString(),
-                value_on_cast_error=value_on_cast_error,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
+        result = amend_text(
+            text=self.BadString(),
+            value_on_cast_error=value_on_cast_error,
+        )
 
         self.assertEqual(
             result,
@@ -355,40 +265,22 @@ class TestAmendText(unittest.TestCase):
     ):
         text = "01"
 
-        try:
-            amend_text(
-                text=text,
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation without defined limits: {e}",
-            )
-
-        try:
-            amend_text(
-                text=text,
-                minimum_length=0,
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation with minimum 0 length: {e}",
-            )
-
-        try:
-            amend_text(
-                text=text,
-                maximum_length=len(text),
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation with exact length maximum: {e}",
-            )
+        amend_text(
+            text=text,
+            length_violation_action="error",
+        )
+
+        amend_text(
+            text=text,
+            minimum_length=0,
+            length_violation_action="error",
+        )
+
+        amend_text(
+            text=text,
+            maximum_length=len(text),
+            length_violation_action="error",
+        )
 
         self.assertRaises(
             ValueError,
@@ -0,0 +1,113 @@
+# Copyright 2025 Miljenko Šuflaj
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from amend.built_in.sequences.sequence_containers import (
+    amend_immutable_sequence,
+    amend_mutable_sequence,
+)
+
+_TRUNCATE_AND_PAD = {
+    "length_violation_action": "truncate-and-pad",
+    "truncation_side": "both-but-prioritize-left",
+    "padding_side": "both-but-prioritize-right",
+    "padding_value": (0,),
+}
+
+
+class TestAmendImmutableSequence(unittest.TestCase):
+    def test_truncate_and_pad(
+        self,
+    ):
+        for (
+            arguments,
+            expected_result,
+        ) in (
+            (
+                {"immutable_sequence": (1, 2, 3, 4, 5), "maximum_length": 2},
+                (3, 4),
+            ),
+            (
+                {"immutable_sequence": (1, 2, 3), "minimum_length": 6},
+                (0, 1, 2, 3, 0, 0),
+            ),
+            (
+                {
+                    "immutable_sequence": (1, 2, 3, 4, 5),
+                    "minimum_length": 6,
+                    "length_is_multiple_of": (4,),
+                },
+                (0, 1, 2, 3, 4, 5, 0, 0),
+            ),
+        ):
+            with self.subTest(**arguments):
+                result = amend_immutable_sequence(
+                    **arguments,
+                    **_TRUNCATE_AND_PAD,
+                )
+
+                self.assertIs(
+                    type(result),
+                    tuple,
+                )
+                self.assertEqual(
+                    result,
+                    expected_result,
+                )
+
+
+class TestAmendMutableSequence(unittest.TestCase):
+    def test_truncate_and_pad(
+        self,
+    ):
+        for (
+            arguments,
+            expected_result,
+        ) in (
+            (
+                {"mutable_sequence": [1, 2, 3, 4, 5], "maximum_length": 2},
+                [3, 4],
+            ),
+            (
+                {"mutable_sequence": [1, 2, 3], "minimum_length": 6},
+                [0, 1, 2, 3, 0, 0],
+            ),
+            (
+                {
+                    "mutable_sequence": [1, 2, 3, 4, 5],
+                    "minimum_length": 6,
+                    "length_is_multiple_of": (4,),
+                },
+                [0, 1, 2, 3, 4, 5, 0, 0],
+            ),
+        ):
+            with self.subTest(**arguments):
+                result = amend_mutable_sequence(
+                    **arguments,
+                    **_TRUNCATE_AND_PAD,
+                )
+
+                self.assertIs(
+                    type(result),
+                    list,
+                )
+                self.assertEqual(
+                    result,
+                    expected_result,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,13 +25,7 @@ class TestAmendImmutableDataSet(unittest.TestCase):
     def test_no_amendment_needed(
         self,
     ):
-        try:
-            amend_immutable_data_set(immutable_data_set=frozenset())
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_immutable_data_set(immutable_data_set=frozenset())
 
     def test_type_mismatch(
         self,
@@ -39,13 +33,7 @@ class TestAmendImmutableDataSet(unittest.TestCase):
         immutable_data_set = {1, 2}
         expected_result = frozenset(immutable_data_set)
 
-        try:
-            result = amend_immutable_data_set(immutable_data_set=immutable_data_set)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_immutable_data_set(immutable_data_set=immutable_data_set)
         self.assertEqual(
             result,
             expected_result,
@@ -75,16 +63,10 @@ class TestAmendImmutableDataSet(unittest.TestCase):
             value_on_cast_error={1, 2},
         )
 
-        try:
-            result = amend_immutable_data_set(
-                immutable_data_set=None,
-                value_on_cast_error=value_on_cast_error,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
+        result = amend_immutable_data_set(
+            immutable_data_set=None,
+            value_on_cast_error=value_on_cast_error,
+        )
 
         self.assertEqual(
             result,
@@ -96,40 +78,22 @@ class TestAmendImmutableDataSet(unittest.TestCase):
     ):
         immutable_data_set = frozenset({1, 2})
 
-        try:
-            amend_immutable_data_set(
-                immutable_data_set=immutable_data_set,
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation without defined limits: {e}",
-            )
-
-        try:
-            amend_immutable_data_set(
-                immutable_data_set=immutable_data_set,
-                minimum_length=0,
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation with minimum 0 length: {e}",
-            )
-
-        try:
-            amend_immutable_data_set(
-                immutable_data_set=immutable_data_set,
-                maximum_length=len(immutable_data_set),
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation with exact length maximum: {e}",
-            )
+        amend_immutable_data_set(
+            immutable_data_set=immutable_data_set,
+            length_violation_action="error",
+        )
+
+        amend_immutable_data_set(
+            immutable_data_set=immutable_data_set,
+            minimum_length=0,
+            length_violation_action="error",
+        )
+
+        amend_immutable_data_set(
+            immutable_data_set=immutable_data_set,
+            maximum_length=len(immutable_data_set),
+            length_violation_action="error",
+        )
 
         self.assertRaises(
             ValueError,
@@ -151,13 +115,7 @@ class TestAmendMutableDataSet(unittest.TestCase):
     def test_no_amendment_needed(
         self,
     ):
-        try:
-            amend_mutable_data_set(mutable_data_set=set())
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_mutable_data_set(mutable_data_set=set())
 
     def test_type_mismatch(
         self,
@@ -165,13 +123,7 @@ class TestAmendMutableDataSet(unittest.TestCase):
         expected_result = {1, 2}
         mutable_data_set = frozenset(expected_result)
 
-        try:
-            result = amend_mutable_data_set(mutable_data_set=mutable_data_set)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_mutable_data_set(mutable_data_set=mutable_data_set)
         self.assertEqual(
             result,
             expected_result,
@@ -201,16 +153,10 @@ class TestAmendMutableDataSet(unittest.TestCase):
             value_on_cast_error={1, 2},
         )
 
-        try:
-            result = amend_mutable_data_set(
-                mutable_data_set=None,
-                value_on_cast_error=value_on_cast_error,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
+        result = amend_mutable_data_set(
+            mutable_data_set=None,
+            value_on_cast_error=value_on_cast_error,
+        )
 
         self.assertEqual(
             result,
@@ -222,40 +168,22 @@ class TestAmendMutableDataSet(unittest.TestCase):
     ):
         mutable_data_set = {1, 2}
 
-        try:
-            amend_mutable_data_set(
-                mutable_data_set=mutable_data_set,
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation without defined limits: {e}",
-            )
-
-        try:
-            amend_mutable_data_set(
-                mutable_data_set=mutable_data_set,
-                minimum_length=0,
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation with minimum 0 length: {e}",
-            )
-
-        try:
-            amend_mutable_data_set(
-                mutable_data_set=mutable_data_set,
-                maximum_length=len(mutable_data_set),
-                length_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for length violation with exact length maximum: {e}",
-            )
+        amend_mutable_data_set(
+            mutable_data_set=mutable_data_set,
+            length_violation_action="error",
+        )
+
+        amend_mutable_data_set(
+            mutable_data_set=mutable_data_set,
+            minimum_length=0,
+            length_violation_action="error",
+        )
+
+        amend_mutable_data_set(
+            mutable_data_set=mutable_data_set,
+            maximum_length=len(mutable_data_set),
+            length_violation_action="error",
+        )
 
         self.assertRaises(
             ValueError,
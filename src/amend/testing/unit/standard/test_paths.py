@@ -22,19 +22,14 @@ from amend.standard.paths import (
     amend_directory,
     amend_file,
 )
+from amend.testing.unit._common import assert_cast_error
 
 
 class TestAmendDirectory(unittest.TestCase):
     def test_no_amendment_needed(
         self,
     ):
-        try:
-            amend_directory(directory=Path(__file__).resolve().parent)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_directory(directory=Path(__file__).resolve().parent)
 
     def test_type_mismatch(
         self,
@@ -42,13 +37,7 @@ class TestAmendDirectory(unittest.TestCase):
         expected_result = Path(__file__).resolve().parent
         directory = str(expected_result)
 
-        try:
-            result = amend_directory(directory=directory)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_directory(directory=directory)
         self.assertEqual(
             result,
             expected_result,
@@ -66,47 +55,21 @@ class TestAmendDirectory(unittest.TestCase):
     ):
         value_on_cast_error = Path(__file__).resolve().parent
 
-        self.assertRaises(
-            TypeError,
-            amend_directory,
-            directory=None,
-        )
-        self.assertRaises(
-            ValueError,
-            amend_directory,
-            directory=None,
-            value_on_cast_error=str(value_on_cast_error),
-        )
-
-        try:
-            result = amend_directory(
-                directory=None,
-                value_on_cast_error=value_on_cast_error,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
-
-        self.assertEqual(
-            result,
-            value_on_cast_error,
+        assert_cast_error(
+            test_case=self,
+            function=amend_directory,
+            argument_name="directory",
+            valid_value_on_cast_error=value_on_cast_error,
+            invalid_value_on_cast_error=str(value_on_cast_error),
         )
 
     def test_not_existing(
         self,
     ):
-        try:
-            amend_directory(
-                directory=Path(__file__).resolve().parent,
-                not_existing_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when directory exists: {e}",
-            )
+        amend_directory(
+            directory=Path(__file__).resolve().parent,
+            not_existing_action="error",
+        )
 
         directory = Path.home().resolve() / ".cache" / str(uuid.uuid4())
 
@@ -116,40 +79,25 @@ class TestAmendDirectory(unittest.TestCase):
             directory=directory,
             not_existing_action="error",
         )
-        try:
-            amend_directory(
-                directory=directory,
-                not_existing_action="make",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when making directory: {e}",
-            )
+        amend_directory(
+            directory=directory,
+            not_existing_action="make",
+        )
         self.assertTrue(
-            directory.exists(),
+            directory.is_dir(),
             f"Failed to make directory {directory}",
         )
-        try:
-            shutil.rmtree(str(directory))
-        except Exception as e:
-            self.assert_(False, f"Threw exception when removing made directory: {e}")
+        shutil.rmtree(str(directory))
 
     def test_category_mismatch(
         self,
     ):
         file = Path(__file__).resolve()
 
-        try:
-            amend_directory(
-                directory=file.parent,
-                category_mismatch_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when entity was directory: {e}",
-            )
+        amend_directory(
+            directory=file.parent,
+            category_mismatch_action="error",
+        )
 
         self.assertRaises(
             NotADirectoryError,
@@ -157,16 +105,10 @@ class TestAmendDirectory(unittest.TestCase):
             directory=file,
             category_mismatch_action="error",
         )
-        try:
-            result = amend_directory(
-                directory=file,
-                category_mismatch_action="take-parent",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when taking parent: {e}",
-            )
+        result = amend_directory(
+            directory=file,
+            category_mismatch_action="take-parent",
+        )
         self.assertEqual(
             result,
             file.parent,
@@ -177,13 +119,7 @@ class TestAmendFile(unittest.TestCase):
     def test_no_amendment_needed(
         self,
     ):
-        try:
-            amend_file(file=Path(__file__).resolve())
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_file(file=Path(__file__).resolve())
 
     def test_type_mismatch(
         self,
@@ -191,13 +127,7 @@ class TestAmendFile(unittest.TestCase):
         expected_result = Path(__file__).resolve()
         file = str(expected_result)
 
-        try:
-            result = amend_file(file=file)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_file(file=file)
         self.assertEqual(
             result,
             expected_result,
@@ -215,47 +145,21 @@ class TestAmendFile(unittest.TestCase):
     ):
         value_on_cast_error = Path(__file__).resolve()
 
-        self.assertRaises(
-            TypeError,
-            amend_file,
-            file=None,
-        )
-        self.assertRaises(
-            ValueError,
-            amend_file,
-            file=None,
-            value_on_cast_error=str(value_on_cast_error),
-        )
-
-        try:
-            result = amend_file(
-                file=None,
-                value_on_cast_error=value_on_cast_error,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
-
-        self.assertEqual(
-            result,
-            value_on_cast_error,
+        assert_cast_error(
+            test_case=self,
+            function=amend_file,
+            argument_name="file",
+            valid_value_on_cast_error=value_on_cast_error,
+            invalid_value_on_cast_error=str(value_on_cast_error),
         )
 
     def test_not_existing(
         self,
     ):
-        try:
-            amend_file(
-                file=Path(__file__).resolve(),
-                not_existing_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when file exists: {e}",
-            )
+        amend_file(
+            file=Path(__file__).resolve(),
+            not_existing_action="error",
+        )
 
         file = Path.home().resolve() / ".cache" / str(uuid.uuid4()) / "test-file"
         self.assertRaises(
@@ -264,65 +168,39 @@ class TestAmendFile(unittest.TestCase):
             file=file,
             not_existing_action="error",
         )
-        try:
-            amend_file(
-                file=file,
-                not_existing_action="make",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when making file: {e}",
-            )
+        amend_file(
+            file=file,
+            not_existing_action="make",
+        )
         self.assertTrue(
-            file.exists(),
+            file.is_file(),
             f"Failed to make file {file}",
         )
-        try:
-            shutil.rmtree(str(file.parent))
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when removing made directory & file: {e}",
-            )
+        shutil.rmtree(str(file.parent))
 
-        try:
-            amend_file(
-                file=file,
-                not_existing_action="make-parent",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when making file parent: {e}",
-            )
+        amend_file(
+            file=file,
+            not_existing_action="make-parent",
+        )
         self.assertTrue(
-            file.parent.exists(),
+            file.parent.is_dir(),
             f"Failed to make directory {file.parent}",
         )
-        try:
-            shutil.rmtree(str(file.parent))
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when removing made directory: {e}",
-            )
+        self.assertFalse(
+            file.exists(),
+            f"Made file {file} when only its parent was needed",
+        )
+        shutil.rmtree(str(file.parent))
 
     def test_category_mismatch(
         self,
     ):
         file = Path(__file__).resolve()
 
-        try:
-            amend_file(
-                file=file,
-                category_mismatch_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when entity was file: {e}",
-            )
+        amend_file(
+            file=file,
+            category_mismatch_action="error",
+        )
 
         self.assertRaises(
             ValueError,
@@ -21,19 +21,14 @@ from amend.standard.temporals import (
     amend_temporal_offset,
     amend_time,
 )
+from amend.testing.unit._common import assert_cast_error
 
 
 class TestAmendDate(unittest.TestCase):
     def test_no_amendment_needed(
         self,
     ):
-        try:
-            amend_date(date=datetime.date.today())
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_date(date=datetime.date.today())
 
     def test_type_mismatch(
         self,
@@ -45,13 +40,7 @@ class TestAmendDate(unittest.TestCase):
             "day": expected_result.day,
         }
 
-        try:
-            result = amend_date(date=date)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_date(date=date)
         self.assertEqual(
             result,
             expected_result,
@@ -69,75 +58,37 @@ class TestAmendDate(unittest.TestCase):
     ):
         value_on_cast_error = datetime.date.today()
 
-        self.assertRaises(
-            TypeError,
-            amend_date,
-            date=None,
-        )
-        self.assertRaises(
-            ValueError,
-            amend_date,
-            date=None,
-            value_on_cast_error={
+        assert_cast_error(
+            test_case=self,
+            function=amend_date,
+            argument_name="date",
+            valid_value_on_cast_error=value_on_cast_error,
+            invalid_value_on_cast_error={
                 "year": value_on_cast_error.year,
                 "month": value_on_cast_error.month,
                 "day": value_on_cast_error.day,
             },
         )
 
-        try:
-            result = amend_date(
-                date=None,
-                value_on_cast_error=value_on_cast_error,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
-
-        self.assertEqual(
-            result,
-            value_on_cast_error,
-        )
-
     def test_value_violation(
         self,
     ):
-        try:
-            amend_date(
-                date=datetime.date.today(),
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation without defined limits: {e}",
-            )
-
-        try:
-            amend_date(
-                date=datetime.date.today(),
-                minimum_value=datetime.date.today(),
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation with exact minimum: {e}",
-            )
-
-        try:
-            amend_date(
-                date=datetime.date.today(),
-                maximum_value=datetime.date.today(),
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation with exact maximum: {e}",
-            )
+        amend_date(
+            date=datetime.date.today(),
+            value_violation_action="error",
+        )
+
+        amend_date(
+            date=datetime.date.today(),
+            minimum_value=datetime.date.today(),
+            value_violation_action="error",
+        )
+
+        amend_date(
+            date=datetime.date.today(),
+            maximum_value=datetime.date.today(),
+            value_violation_action="error",
+        )
 
         self.assertRaises(
             ValueError,
@@ -159,13 +110,7 @@ class TestAmendDateAndTime(unittest.TestCase):
     def test_no_amendment_needed(
         self,
     ):
-        try:
-            amend_date_and_time(date_and_time=datetime.datetime.now())
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_date_and_time(date_and_time=datetime.datetime.now())
 
     def test_type_mismatch(
         self,
@@ -181,13 +126,7 @@ class TestAmendDateAndTime(unittest.TestCase):
             "microsecond": expected_result.microsecond,
         }
 
-        try:
-            result = amend_date_and_time(date_and_time=date_and_time)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_date_and_time(date_and_time=date_and_time)
         self.assertEqual(
             result,
             expected_result,
@@ -205,16 +144,12 @@ class TestAmendDateAndTime(unittest.TestCase):
     ):
         value_on_cast_error = datetime.datetime.now()
 
-        self.assertRaises(
-            TypeError,
-            amend_date_and_time,
-            date_and_time=None,
-        )
-        self.assertRaises(
-            ValueError,
-            amend_date_and_time,
-            date_and_time=None,
-            value_on_cast_error={
+        assert_cast_error(
+            test_case=self,
+            function=amend_date_and_time,
+            argument_name="date_and_time",
+            valid_value_on_cast_error=value_on_cast_error,
+            invalid_value_on_cast_error={
                 "year": value_on_cast_error.year,
                 "month": value_on_cast_error.month,
                 "day": value_on_cast_error.day,
@@ -225,60 +160,26 @@ class TestAmendDateAndTime(unittest.TestCase):
             },
         )
 
-        try:
-            result = amend_date_and_time(
-                date_and_time=None,
-                value_on_cast_error=value_on_cast_error,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
-
-        self.assertEqual(
-            result,
-            value_on_cast_error,
-        )
-
     def test_value_violation(
         self,
     ):
-        try:
-            amend_date_and_time(
-                date_and_time=datetime.datetime.now(),
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation without defined limits: {e}",
-            )
+        amend_date_and_time(
+            date_and_time=datetime.datetime.now(),
+            value_violation_action="error",
+        )
 
         date_and_time = datetime.datetime.now()
-        try:
-            amend_date_and_time(
-                date_and_time=date_and_time,
-                minimum_value=date_and_time,
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation with exact minimum: {e}",
-            )
-
-        try:
-            amend_date(
-                date=date_and_time,
-                maximum_value=date_and_time,
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation with exact maximum: {e}",
-            )
+        amend_date_and_time(
+            date_and_time=date_and_time,
+            minimum_value=date_and_time,
+            value_violation_action="error",
+        )
+
+        amend_date(
+            date=date_and_time,
+            maximum_value=date_and_time,
+            value_violation_action="error",
+        )
 
         self.assertRaises(
             ValueError,
@@ -300,13 +201,7 @@ class TestAmendTemporalOffset(unittest.TestCase):
     def test_no_amendment_needed(
         self,
     ):
-        try:
-            amend_temporal_offset(temporal_offset=datetime.timedelta())
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_temporal_offset(temporal_offset=datetime.timedelta())
 
     def test_type_mismatch(
         self,
@@ -318,13 +213,7 @@ class TestAmendTemporalOffset(unittest.TestCase):
             "microseconds": expected_result.microseconds,
         }
 
-        try:
-            result = amend_temporal_offset(temporal_offset=temporal_offset)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_temporal_offset(temporal_offset=temporal_offset)
         self.assertEqual(
             result,
             expected_result,
@@ -342,75 +231,37 @@ class TestAmendTemporalOffset(unittest.TestCase):
     ):
         value_on_cast_error = datetime.timedelta(microseconds=1)
 
-        self.assertRaises(
-            TypeError,
-            amend_temporal_offset,
-            temporal_offset=None,
-        )
-        self.assertRaises(
-            ValueError,
-            amend_temporal_offset,
-            temporal_offset=None,
-            value_on_cast_error={
+        assert_cast_error(
+            test_case=self,
+            function=amend_temporal_offset,
+            argument_name="temporal_offset",
+            valid_value_on_cast_error=value_on_cast_error,
+            invalid_value_on_cast_error={
                 "days": value_on_cast_error.days,
                 "seconds": value_on_cast_error.seconds,
                 "microseconds": value_on_cast_error.microseconds,
             },
         )
 
-        try:
-            result = amend_temporal_offset(
-                temporal_offset=None,
-                value_on_cast_error=value_on_cast_error,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
-
-        self.assertEqual(
-            result,
-            value_on_cast_error,
-        )
-
     def test_value_violation(
         self,
     ):
-        try:
-            amend_temporal_offset(
-                temporal_offset=datetime.timedelta(microseconds=1),
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation without defined limits: {e}",
-            )
-
-        try:
-            amend_temporal_offset(
-                temporal_offset=datetime.timedelta(microseconds=1),
-                minimum_value=datetime.timedelta(microseconds=1),
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation with exact minimum: {e}",
-            )
-
-        try:
-            amend_temporal_offset(
-                temporal_offset=datetime.timedelta(microseconds=1),
-                maximum_value=datetime.timedelta(microseconds=1),
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation with exact maximum: {e}",
-            )
+        amend_temporal_offset(
+            temporal_offset=datetime.timedelta(microseconds=1),
+            value_violation_action="error",
+        )
+
+        amend_temporal_offset(
+            temporal_offset=datetime.timedelta(microseconds=1),
+            minimum_value=datetime.timedelta(microseconds=1),
+            value_violation_action="error",
+        )
+
+        amend_temporal_offset(
+            temporal_offset=datetime.timedelta(microseconds=1),
+            maximum_value=datetime.timedelta(microseconds=1),
+            value_violation_action="error",
+        )
 
         self.assertRaises(
             ValueError,
@@ -432,13 +283,7 @@ class TestAmendTime(unittest.TestCase):
     def test_no_amendment_needed(
         self,
     ):
-        try:
-            amend_time(time=datetime.datetime.now().time())
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no amendment was needed: {e}",
-            )
+        amend_time(time=datetime.datetime.now().time())
 
     def test_type_mismatch(
         self,
@@ -452,13 +297,7 @@ class TestAmendTime(unittest.TestCase):
             "tzinfo": expected_result.tzinfo,
         }
 
-        try:
-            result = amend_time(time=time)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when amendment was possible: {e}",
-            )
+        result = amend_time(time=time)
         self.assertEqual(
             result,
             expected_result,
@@ -476,16 +315,12 @@ class TestAmendTime(unittest.TestCase):
     ):
         value_on_cast_error = datetime.datetime.now().time()
 
-        self.assertRaises(
-            TypeError,
-            amend_time,
-            time=None,
-        )
-        self.assertRaises(
-            ValueError,
-            amend_time,
-            time=None,
-            value_on_cast_error={
+        assert_cast_error(
+            test_case=self,
+            function=amend_time,
+            argument_name="time",
+            valid_value_on_cast_error=value_on_cast_error,
+            invalid_value_on_cast_error={
                 "hour": value_on_cast_error.hour,
                 "minute": value_on_cast_error.minute,
                 "second": value_on_cast_error.second,
@@ -494,60 +329,26 @@ class TestAmendTime(unittest.TestCase):
             },
         )
 
-        try:
-            result = amend_time(
-                time=None,
-                value_on_cast_error=value_on_cast_error,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when value on cast error was valid: {e}",
-            )
-
-        self.assertEqual(
-            result,
-            value_on_cast_error,
-        )
-
     def test_value_violation(
         self,
     ):
-        try:
-            amend_time(
-                time=datetime.datetime.now().time(),
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation without defined limits: {e}",
-            )
+        amend_time(
+            time=datetime.datetime.now().time(),
+            value_violation_action="error",
+        )
 
         time = datetime.datetime.now().time()
-        try:
-            amend_time(
-                time=time,
-                minimum_value=time,
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation with exact minimum: {e}",
-            )
-
-        try:
-            amend_time(
-                time=time,
-                maximum_value=time,
-                value_violation_action="error",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception for value violation with exact maximum: {e}",
-            )
+        amend_time(
+            time=time,
+            minimum_value=time,
+            value_violation_action="error",
+        )
+
+        amend_time(
+            time=time,
+            maximum_value=time,
+            value_violation_action="error",
+        )
 
         time = datetime.datetime.now()
         earlier_time = time - datetime.timedelta(microseconds=1)
@@ -3,6 +3,7 @@ import unittest
 from amend.testing.unit.utilities.test_normalization import (
     TestImmutableMappingAcquisition,
     TestLeastCommonMultiplierSearch,
+    TestLengthIteration,
     TestLengthNormalizationOfImmutableBinary,
     TestLengthNormalizationOfImmutableSequence,
     TestLengthNormalizationOfMutableBinary,
@@ -12,350 +12,539 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+import types
 import unittest
 
-# NOTE: Iteration over satisfying constraints is not tested, as it's
-# (potentially) an infinite iterator, and because its inner workings should
-# already be covered under tests for 'determine_length_normalization_strategy',
+# NOTE: Iteration over satisfying constraints is (potentially) infinite, so only its
+# first proposals and its validation are tested; its inner workings should already be
+# covered under tests for 'determine_length_normalization_strategy',
 # 'find_least_common_multiplier' and length-normalization functions.
 from amend.utilities.normalization import (
     determine_length_normalization_strategy,
     find_least_common_multiplier,
     get_immutable_mapping,
+    iterate_over_lengths_satisfying_constraints,
     normalize_length_of_immutable_binary,
     normalize_length_of_immutable_sequence,
     normalize_length_of_mutable_binary,
     normalize_length_of_mutable_sequence,
     normalize_length_of_text,
 )
+from amend.testing.unit._common import assert_sequences_almost_equal
+
+# NOTE: Inputs shared by the length-normalization tests. Mutable inputs are copied
+# from these in every case, so no case can see another one's modifications.
+_BINARY = b"12345"
+_SEQUENCE = (1, 2, 3, 4, 5)
+_TEXT = "12345"
+
+# NOTE: Large multiples and their least common multipliers used in LCM tests.
+_LARGE_MULTIPLE = 5782165987216521
+_LCM_OF_LARGE_PAIR = 24438297619684113049299
+_LCM_OF_LARGE_REPEATING_TRIPLE = 28128792745201496964329
+
+# NOTE: Each case is a pair of keyword arguments and the expected strategy.
+_STRATEGIES_WITHOUT_MODIFICATION = (
+    (
+        {
+            "length": 1,
+        },
+        (0, 0),
+    ),
+    (
+        {
+            "length": 1,
+            "minimum_length": 1,
+        },
+        (0, 0),
+    ),
+    (
+        {
+            "length": 1,
+            "maximum_length": 1,
+        },
+        (0, 0),
+    ),
+    (
+        {
+            "length": 2,
+            "length_is_multiple_of": (2,),
+        },
+        (0, 0),
+    ),
+)
 
+_STRATEGIES_WITH_TRUNCATION = (
+    (
+        {
+            "length": 5,
+            "maximum_length": 2,
+            "truncation_side": "left",
+        },
+        (-3, 0),
+    ),
+    (
+        {
+            "length": 5,
+            "maximum_length": 2,
+            "truncation_side": "right",
+        },
+        (0, -3),
+    ),
+    (
+        {
+            "length": 5,
+            "maximum_length": 2,
+            "truncation_side": "both-but-prioritize-left",
+        },
+        (-2, -1),
+    ),
+    (
+        {
+            "length": 5,
+            "maximum_length": 2,
+            "truncation_side": "both-but-prioritize-right",
+        },
+        (-1, -2),
+    ),
+    (
+        {
+            "length": 2,
+            "minimum_length": 5,
+            "truncation_side": "left",
+        },
+        None,
+    ),
+)
 
-class TestLengthNormalizationStrategyDetermination(unittest.TestCase):
-    def test_no_modification_needed(self):
-        try:
-            determine_length_normalization_strategy(length=1)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when no modification was needed: {e}",
-            )
+_STRATEGIES_WITH_PADDING = (
+    (
+        {
+            "length": 2,
+            "minimum_length": 5,
+            "padding_side": "left",
+        },
+        (3, 0),
+    ),
+    (
+        {
+            "length": 2,
+            "minimum_length": 5,
+            "padding_side": "right",
+        },
+        (0, 3),
+    ),
+    (
+        {
+            "length": 2,
+            "minimum_length": 5,
+            "padding_side": "both-but-prioritize-left",
+        },
+        (2, 1),
+    ),
+    (
+        {
+            "length": 2,
+            "minimum_length": 5,
+            "padding_side": "both-but-prioritize-right",
+        },
+        (1, 2),
+    ),
+)
 
-        try:
-            determine_length_normalization_strategy(
-                length=1,
-                minimum_length=1,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception with exact minimum: {e}",
-            )
+_STRATEGIES_WITH_MULTIPLE_OF = (
+    (
+        {
+            "length": 4,
+            "length_is_multiple_of": (2,),
+        },
+        (0, 0),
+    ),
+    (
+        {
+            "length": 4,
+            "length_is_multiple_of": (2, 4),
+        },
+        (0, 0),
+    ),
+    (
+        {
+            "length": 10,
+            "length_is_multiple_of": (2, 5),
+        },
+        (0, 0),
+    ),
+    (
+        {
+            "length": 5,
+            "length_is_multiple_of": (3,),
+            "truncation_side": "left",
+        },
+        (-2, 0),
+    ),
+    (
+        {
+            "length": 5,
+            "length_is_multiple_of": (3,),
+            "truncation_side": "right",
+        },
+        (0, -2),
+    ),
+    (
+        {
+            "length": 8,
+            "length_is_multiple_of": (5,),
+            "truncation_side": "both-but-prioritize-left",
+        },
+        (-2, -1),
+    ),
+    (
+        {
+            "length": 8,
+            "length_is_multiple_of": (5,),
+            "truncation_side": "both-but-prioritize-right",
+        },
+        (-1, -2),
+    ),
+    (
+        {
+            "length": 5,
+            "length_is_multiple_of": (3,),
+            "padding_side": "left",
+        },
+        (1, 0),
+    ),
+    (
+        {
+            "length": 5,
+            "length_is_multiple_of": (3,),
+            "padding_side": "right",
+        },
+        (0, 1),
+    ),
+    (
+        {
+            "length": 7,
+            "length_is_multiple_of": (5,),
+            "padding_side": "both-but-prioritize-left",
+        },
+        (2, 1),
+    ),
+    (
+        {
+            "length": 7,
+            "length_is_multiple_of": (5,),
+            "padding_side": "both-but-prioritize-right",
+        },
+        (1, 2),
+    ),
+)
 
-        try:
-            determine_length_normalization_strategy(
-                length=1,
-                maximum_length=1,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception with exact maximum: {e}",
-            )
+# NOTE: Each case is a pair of keyword arguments and the expected immutable binary.
+# Mutable binary cases expect the same bytes in a bytearray.
+_BINARY_TRUNCATIONS = (
+    (
+        {
+            "proposed_length_change": (-1, 0),
+        },
+        b"2345",
+    ),
+    (
+        {
+            "proposed_length_change": (0, -1),
+        },
+        b"1234",
+    ),
+    (
+        {
+            "proposed_length_change": (-2, -1),
+        },
+        b"34",
+    ),
+    (
+        {
+            "proposed_length_change": (-6, 0),
+        },
+        b"",
+    ),
+    (
+        {
+            "proposed_length_change": (0, -6),
+        },
+        b"",
+    ),
+)
 
-        try:
-            determine_length_normalization_strategy(
-                length=2,
-                length_is_multiple_of=(2,),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception with exact length-is-multiple-of: {e}",
-            )
+_BINARY_PADDINGS = (
+    (
+        {
+            "proposed_length_change": (1, 0),
+        },
+        b"\x0012345",
+    ),
+    (
+        {
+            "proposed_length_change": (0, 1),
+        },
+        b"12345\x00",
+    ),
+    (
+        {
+            "proposed_length_change": (1, 2),
+        },
+        b"\x0012345\x00\x00",
+    ),
+    (
+        {
+            "proposed_length_change": (2, 1),
+            "padding_value": b"a",
+        },
+        b"aa12345a",
+    ),
+    (
+        {
+            "proposed_length_change": (3, 4),
+            "padding_value": b"ab",
+        },
+        b"aba12345abab",
+    ),
+)
 
-    def test_truncation(self):
-        try:
-            result = determine_length_normalization_strategy(
-                length=5,
-                maximum_length=2,
-                truncation_side="left",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (-3, 0),
-        )
+# NOTE: Each case is a pair of keyword arguments and the expected text.
+_TEXT_TRUNCATIONS = (
+    (
+        {
+            "proposed_length_change": (-1, 0),
+        },
+        "2345",
+    ),
+    (
+        {
+            "proposed_length_change": (0, -1),
+        },
+        "1234",
+    ),
+    (
+        {
+            "proposed_length_change": (-2, -1),
+        },
+        "34",
+    ),
+    (
+        {
+            "proposed_length_change": (-6, 0),
+        },
+        "",
+    ),
+    (
+        {
+            "proposed_length_change": (0, -6),
+        },
+        "",
+    ),
+)
 
-        try:
-            result = determine_length_normalization_strategy(
-                length=5,
-                maximum_length=2,
-                truncation_side="right",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (0, -3),
-        )
+_TEXT_PADDINGS = (
+    (
+        {
+            "proposed_length_change": (1, 0),
+        },
+        "_12345",
+    ),
+    (
+        {
+            "proposed_length_change": (0, 1),
+        },
+        "12345_",
+    ),
+    (
+        {
+            "proposed_length_change": (1, 2),
+        },
+        "_12345__",
+    ),
+    (
+        {
+            "proposed_length_change": (2, 1),
+            "padding_value": "a",
+        },
+        "aa12345a",
+    ),
+    (
+        {
+            "proposed_length_change": (3, 4),
+            "padding_value": "ab",
+        },
+        "aba12345abab",
+    ),
+)
 
-        try:
-            result = determine_length_normalization_strategy(
-                length=5,
-                maximum_length=2,
-                truncation_side="both-but-prioritize-left",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (-2, -1),
-        )
+# NOTE: Each case is a pair of keyword arguments and the expected immutable sequence.
+# Mutable sequence cases expect the same elements in a list.
+_SEQUENCE_TRUNCATIONS = (
+    (
+        {
+            "proposed_length_change": (-1, 0),
+        },
+        (2, 3, 4, 5),
+    ),
+    (
+        {
+            "proposed_length_change": (0, -1),
+        },
+        (1, 2, 3, 4),
+    ),
+    (
+        {
+            "proposed_length_change": (-2, -1),
+        },
+        (3, 4),
+    ),
+    (
+        {
+            "proposed_length_change": (-6, 0),
+        },
+        tuple(),
+    ),
+    (
+        {
+            "proposed_length_change": (0, -6),
+        },
+        tuple(),
+    ),
+)
 
-        try:
-            result = determine_length_normalization_strategy(
-                length=5,
-                maximum_length=2,
-                truncation_side="both-but-prioritize-right",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (-1, -2),
-        )
+_SEQUENCE_PADDINGS = (
+    (
+        {
+            "proposed_length_change": (1, 0),
+        },
+        (None, 1, 2, 3, 4, 5),
+    ),
+    (
+        {
+            "proposed_length_change": (0, 1),
+        },
+        (1, 2, 3, 4, 5, None),
+    ),
+    (
+        {
+            "proposed_length_change": (1, 2),
+        },
+        (None, 1, 2, 3, 4, 5, None, None),
+    ),
+    (
+        {
+            "proposed_length_change": (2, 1),
+            "padding_value": (0,),
+        },
+        (0, 0, 1, 2, 3, 4, 5, 0),
+    ),
+    (
+        {
+            "proposed_length_change": (3, 4),
+            "padding_value": (-1, -2),
+        },
+        (-1, -2, -1, 1, 2, 3, 4, 5, -1, -2, -1, -2),
+    ),
+    (
+        {
+            "proposed_length_change": (4, 3),
+            "padding_value": ("test", 1.2),
+        },
+        ("test", 1.2, "test", 1.2, 1, 2, 3, 4, 5, "test", 1.2, "test"),
+    ),
+)
 
-    def test_padding(self):
-        try:
-            result = determine_length_normalization_strategy(
-                length=2,
-                minimum_length=5,
-                padding_side="left",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (3, 0),
-        )
 
-        try:
-            result = determine_length_normalization_strategy(
-                length=2,
-                minimum_length=5,
-                padding_side="right",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (0, 3),
-        )
+class TestLengthIteration(unittest.TestCase):
+    def test_validation(self):
+        # NOTE: Constraints are validated on call, so the iterator is never advanced.
+        for (
+            exception_type,
+            arguments,
+        ) in (
+            (
+                TypeError,
+                {"length": "5"},
+            ),
+            (
+                ValueError,
+                {"length": -1},
+            ),
+            (
+                ValueError,
+                {"length": 5, "length_is_multiple_of": (0,)},
+            ),
+        ):
+            with self.subTest(**arguments):
+                self.assertRaises(
+                    exception_type,
+                    iterate_over_lengths_satisfying_constraints,
+                    **arguments,
+                )
 
-        try:
-            result = determine_length_normalization_strategy(
-                length=2,
-                minimum_length=5,
-                padding_side="both-but-prioritize-left",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
+    def test_proposals(self):
         self.assertEqual(
-            result,
-            (2, 1),
+            list(
+                itertools.islice(
+                    iterate_over_lengths_satisfying_constraints(
+                        length=5,
+                        minimum_length=3,
+                        length_is_multiple_of=(2,),
+                    ),
+                    5,
+                )
+            ),
+            [-1, 1, 3, 5, 7],
         )
 
-        try:
-            result = determine_length_normalization_strategy(
-                length=2,
-                minimum_length=5,
-                padding_side="both-but-prioritize-right",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (1, 2),
-        )
 
-    def test_multiple_of(self):
-        try:
-            result = determine_length_normalization_strategy(
-                length=4,
-                length_is_multiple_of=(2,),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when length was already valid multiple-of: {e}",
-            )
-        try:
-            result = determine_length_normalization_strategy(
-                length=4,
-                length_is_multiple_of=(2, 4),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when length was already valid multiple-of: {e}",
-            )
-        try:
-            result = determine_length_normalization_strategy(
-                length=10,
-                length_is_multiple_of=(2, 5),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when length was already valid multiple-of: {e}",
-            )
+class TestLengthNormalizationStrategyDetermination(unittest.TestCase):
+    def test_no_modification_needed(self):
+        for (
+            arguments,
+            expected_result,
+        ) in _STRATEGIES_WITHOUT_MODIFICATION:
+            with self.subTest(**arguments):
+                self.assertEqual(
+                    determine_length_normalization_strategy(**arguments),
+                    expected_result,
+                )
 
-        try:
-            result = determine_length_normalization_strategy(
-                length=5,
-                length_is_multiple_of=(3,),
-                truncation_side="left",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (-2, 0),
-        )
-        try:
-            result = determine_length_normalization_strategy(
-                length=5,
-                length_is_multiple_of=(3,),
-                truncation_side="right",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (0, -2),
-        )
-        try:
-            result = determine_length_normalization_strategy(
-                length=8,
-                length_is_multiple_of=(5,),
-                truncation_side="both-but-prioritize-left",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (-2, -1),
-        )
-        try:
-            result = determine_length_normalization_strategy(
-                length=8,
-                length_is_multiple_of=(5,),
-                truncation_side="both-but-prioritize-right",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (-1, -2),
-        )
+    def test_truncation(self):
+        for (
+            arguments,
+            expected_result,
+        ) in _STRATEGIES_WITH_TRUNCATION:
+            with self.subTest(**arguments):
+                self.assertEqual(
+                    determine_length_normalization_strategy(**arguments),
+                    expected_result,
+                )
 
-        try:
-            result = determine_length_normalization_strategy(
-                length=5,
-                length_is_multiple_of=(3,),
-                padding_side="left",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (1, 0),
-        )
-        try:
-            result = determine_length_normalization_strategy(
-                length=5,
-                length_is_multiple_of=(3,),
-                padding_side="right",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (0, 1),
-        )
-        try:
-            result = determine_length_normalization_strategy(
-                length=7,
-                length_is_multiple_of=(5,),
-                padding_side="both-but-prioritize-left",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (2, 1),
-        )
-        try:
-            result = determine_length_normalization_strategy(
-                length=7,
-                length_is_multiple_of=(5,),
-                padding_side="both-but-prioritize-right",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (1, 2),
-        )
+    def test_padding(self):
+        for (
+            arguments,
+            expected_result,
+        ) in _STRATEGIES_WITH_PADDING:
+            with self.subTest(**arguments):
+                self.assertEqual(
+                    determine_length_normalization_strategy(**arguments),
+                    expected_result,
+                )
+
+    def test_multiple_of(self):
+        for (
+            arguments,
+            expected_result,
+        ) in _STRATEGIES_WITH_MULTIPLE_OF:
+            with self.subTest(**arguments):
+                self.assertEqual(
+                    determine_length_normalization_strategy(**arguments),
+                    expected_result,
+                )
 
 
 class TestLeastCommonMultiplierSearch(unittest.TestCase):
@@ -371,40 +560,22 @@ class TestLeastCommonMultiplierSearch(unittest.TestCase):
             multiples=(0,),
         )
 
-        try:
-            result = find_least_common_multiplier(multiples=(1,))
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when common multiplier exists: {e}",
-            )
+        result = find_least_common_multiplier(multiples=(1,))
         self.assertEqual(
             result,
             1,
         )
 
-        try:
-            result = find_least_common_multiplier(multiples=(2,))
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when common multiplier exists: {e}",
-            )
+        result = find_least_common_multiplier(multiples=(2,))
         self.assertEqual(
             result,
             2,
         )
 
-        try:
-            result = find_least_common_multiplier(multiples=(5782165987216521,))
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when common multiplier exists: {e}",
-            )
+        result = find_least_common_multiplier(multiples=(_LARGE_MULTIPLE,))
         self.assertEqual(
             result,
-            5782165987216521,
+            _LARGE_MULTIPLE,
         )
 
     def test_multiple_common_multiplier_search(self):
@@ -424,52 +595,28 @@ class TestLeastCommonMultiplierSearch(unittest.TestCase):
             multiples=(2, 3, 5, -1),
         )
 
-        try:
-            result = find_least_common_multiplier(multiples=(1, 2))
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when common multiplier exists: {e}",
-            )
+        result = find_least_common_multiplier(multiples=(1, 2))
         self.assertEqual(
             result,
             2,
         )
 
-        try:
-            result = find_least_common_multiplier(multiples=(2, 4))
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when common multiplier exists: {e}",
-            )
+        result = find_least_common_multiplier(multiples=(2, 4))
         self.assertEqual(
             result,
             4,
         )
 
-        try:
-            result = find_least_common_multiplier(multiples=(2, 3, 6))
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when common multiplier exists: {e}",
-            )
+        result = find_least_common_multiplier(multiples=(2, 3, 6))
         self.assertEqual(
             result,
             6,
         )
 
-        try:
-            result = find_least_common_multiplier(multiples=(426781469721, 57261852619))
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when common multiplier exists: {e}",
-            )
+        result = find_least_common_multiplier(multiples=(426781469721, 57261852619))
         self.assertEqual(
             result,
-            24438297619684113049299,
+            _LCM_OF_LARGE_PAIR,
         )
 
     def test_multiple_repeating_common_multiplier_search(self):
@@ -489,912 +636,266 @@ class TestLeastCommonMultiplierSearch(unittest.TestCase):
             multiples=(2, 3, 5, 5, -1, -1),
         )
 
-        try:
-            result = find_least_common_multiplier(multiples=(1, 1))
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when common multiplier exists: {e}",
-            )
+        result = find_least_common_multiplier(multiples=(1, 1))
         self.assertEqual(
             result,
             1,
         )
 
-        try:
-            result = find_least_common_multiplier(multiples=(2, 2, 4))
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when common multiplier exists: {e}",
-            )
+        result = find_least_common_multiplier(multiples=(2, 2, 4))
         self.assertEqual(
             result,
             4,
         )
 
-        try:
-            result = find_least_common_multiplier(multiples=(2, 2, 3, 3, 6))
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when common multiplier exists: {e}",
-            )
+        result = find_least_common_multiplier(multiples=(2, 2, 3, 3, 6))
         self.assertEqual(
             result,
             6,
         )
 
-        try:
-            result = find_least_common_multiplier(
-                multiples=(3271849, 8597216052819521, 3271849)
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when common multiplier exists: {e}",
-            )
+        result = find_least_common_multiplier(
+            multiples=(3271849, 8597216052819521, 3271849)
+        )
         self.assertEqual(
             result,
-            28128792745201496964329,
+            _LCM_OF_LARGE_REPEATING_TRIPLE,
         )
 
 
 class TestImmutableMappingAcquisition(unittest.TestCase):
-    def test_identity(self):
-        mutable_mapping = {
-            "a": 1,
-            "b": 2,
-            "c": 0,
-        }
-        immutable_mapping = (
+    @classmethod
+    def setUpClass(cls):
+        # NOTE: The mapping is shared between tests, so it's exposed read-only.
+        cls.mapping = types.MappingProxyType(
+            {
+                "a": 1,
+                "b": 2,
+                "c": 0,
+            }
+        )
+        cls.immutable_mapping = (
             ("a", 1),
             ("b", 2),
             ("c", 0),
         )
 
-        try:
-            result = get_immutable_mapping(
-                mapping=mutable_mapping,
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when immutable mapping acquisition was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            immutable_mapping,
-        )
+    def test_identity(self):
+        # NOTE: Plain dicts are copied from the shared mapping, so no test can modify it.
+        for mapping in (
+            dict(self.mapping),
+            self.mapping,
+        ):
+            with self.subTest(mapping_type=type(mapping).__name__):
+                result = get_immutable_mapping(
+                    mapping=mapping,
+                )
+                self.assertEqual(
+                    result,
+                    self.immutable_mapping,
+                )
 
-        try:
-            result = dict(immutable_mapping)
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when tuple could become dictionary: {e}",
-            )
+    def test_round_trip(self):
+        # NOTE: This only checks that the immutable mapping converts back to a dict.
+        result = dict(self.immutable_mapping)
         self.assertEqual(
             result,
-            mutable_mapping,
+            self.mapping,
         )
 
 
 class TestLengthNormalizationOfImmutableBinary(unittest.TestCase):
     def test_truncation(self):
-        try:
-            result = normalize_length_of_immutable_binary(
-                immutable_binary=b"12345",
-                proposed_length_change=(-1, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            b"2345",
-        )
-        try:
-            result = normalize_length_of_immutable_binary(
-                immutable_binary=b"12345",
-                proposed_length_change=(0, -1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            b"1234",
-        )
-        try:
-            result = normalize_length_of_immutable_binary(
-                immutable_binary=b"12345",
-                proposed_length_change=(-2, -1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            b"34",
-        )
-
-        try:
-            result = normalize_length_of_immutable_binary(
-                immutable_binary=b"12345",
-                proposed_length_change=(-6, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was sane: {e}",
-            )
-        self.assertEqual(
-            result,
-            b"",
-        )
-        try:
-            result = normalize_length_of_immutable_binary(
-                immutable_binary=b"12345",
-                proposed_length_change=(0, -6),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was sane: {e}",
-            )
-        self.assertEqual(
-            result,
-            b"",
-        )
+        for (
+            arguments,
+            expected_result,
+        ) in _BINARY_TRUNCATIONS:
+            with self.subTest(**arguments):
+                self.assertEqual(
+                    normalize_length_of_immutable_binary(
+                        immutable_binary=_BINARY,
+                        **arguments,
+                    ),
+                    expected_result,
+                )
 
     def test_padding(self):
-        try:
-            result = normalize_length_of_immutable_binary(
-                immutable_binary=b"12345",
-                proposed_length_change=(1, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            b"".join(
-                (
-                    b"\0",
-                    b"12345",
+        for (
+            arguments,
+            expected_result,
+        ) in _BINARY_PADDINGS:
+            with self.subTest(**arguments):
+                self.assertEqual(
+                    normalize_length_of_immutable_binary(
+                        immutable_binary=_BINARY,
+                        **arguments,
+                    ),
+                    expected_result,
                 )
-            ),
-        )
-        try:
-            result = normalize_length_of_immutable_binary(
-                immutable_binary=b"12345",
-                proposed_length_change=(0, 1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            b"".join(
-                (
-                    b"12345",
-                    b"\0",
-                )
-            ),
-        )
-        try:
-            result = normalize_length_of_immutable_binary(
-                immutable_binary=b"12345",
-                proposed_length_change=(1, 2),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            b"".join(
-                (
-                    b"\0",
-                    b"12345",
-                    b"\0",
-                    b"\0",
-                )
-            ),
-        )
-
-        try:
-            result = normalize_length_of_immutable_binary(
-                immutable_binary=b"12345",
-                proposed_length_change=(2, 1),
-                padding_value=b"a",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            b"aa12345a",
-        )
-        try:
-            result = normalize_length_of_immutable_binary(
-                immutable_binary=b"12345",
-                proposed_length_change=(3, 4),
-                padding_value=b"ab",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            b"aba12345abab",
-        )
 
 
 class TestLengthNormalizationOfImmutableSequence(unittest.TestCase):
     def test_truncation(self):
-        try:
-            result = normalize_length_of_immutable_sequence(
-                immutable_sequence=(1, 2, 3, 4, 5),
-                proposed_length_change=(-1, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (2, 3, 4, 5),
-        )
-        try:
-            result = normalize_length_of_immutable_sequence(
-                immutable_sequence=(1, 2, 3, 4, 5),
-                proposed_length_change=(0, -1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (1, 2, 3, 4),
-        )
-        try:
-            result = normalize_length_of_immutable_sequence(
-                immutable_sequence=(1, 2, 3, 4, 5),
-                proposed_length_change=(-2, -1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (3, 4),
-        )
-
-        try:
-            result = normalize_length_of_immutable_sequence(
-                immutable_sequence=(1, 2, 3, 4, 5),
-                proposed_length_change=(-6, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was sane: {e}",
-            )
-        self.assertEqual(
-            result,
-            tuple(),
-        )
-        try:
-            result = normalize_length_of_immutable_sequence(
-                immutable_sequence=(1, 2, 3, 4, 5),
-                proposed_length_change=(0, -6),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was sane: {e}",
-            )
-        self.assertEqual(
-            result,
-            tuple(),
-        )
+        for (
+            arguments,
+            expected_result,
+        ) in _SEQUENCE_TRUNCATIONS:
+            with self.subTest(**arguments):
+                self.assertEqual(
+                    normalize_length_of_immutable_sequence(
+                        immutable_sequence=_SEQUENCE,
+                        **arguments,
+                    ),
+                    expected_result,
+                )
 
     def test_padding(self):
-        try:
-            result = normalize_length_of_immutable_sequence(
-                immutable_sequence=(1, 2, 3, 4, 5),
-                proposed_length_change=(1, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (None, 1, 2, 3, 4, 5),
-        )
-        try:
-            result = normalize_length_of_immutable_sequence(
-                immutable_sequence=(1, 2, 3, 4, 5),
-                proposed_length_change=(0, 1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (1, 2, 3, 4, 5, None),
-        )
-        try:
-            result = normalize_length_of_immutable_sequence(
-                immutable_sequence=(1, 2, 3, 4, 5),
-                proposed_length_change=(1, 2),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (None, 1, 2, 3, 4, 5, None, None),
-        )
-        try:
-            result = normalize_length_of_immutable_sequence(
-                immutable_sequence=(1, 2, 3, 4, 5),
-                proposed_length_change=(2, 1),
-                padding_value=(0,),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (0, 0, 1, 2, 3, 4, 5, 0),
-        )
-
-        try:
-            result = normalize_length_of_immutable_sequence(
-                immutable_sequence=(1, 2, 3, 4, 5),
-                proposed_length_change=(3, 4),
-                padding_value=(-1, -2),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            (-1, -2, -1, 1, 2, 3, 4, 5, -1, -2, -1, -2),
-        )
-        try:
-            result = normalize_length_of_immutable_sequence(
-                immutable_sequence=(1, 2, 3, 4, 5),
-                proposed_length_change=(4, 3),
-                padding_value=("test", 1.2),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertAlmostEqual(
-            result,
-            ("test", 1.2, "test", 1.2, 1, 2, 3, 4, 5, "test", 1.2, "test"),
-        )
+        for (
+            arguments,
+            expected_result,
+        ) in _SEQUENCE_PADDINGS:
+            with self.subTest(**arguments):
+                assert_sequences_almost_equal(
+                    test_case=self,
+                    first=normalize_length_of_immutable_sequence(
+                        immutable_sequence=_SEQUENCE,
+                        **arguments,
+                    ),
+                    second=expected_result,
+                )
 
 
 class TestLengthNormalizationOfMutableBinary(unittest.TestCase):
     def test_truncation(self):
-        try:
-            result = normalize_length_of_mutable_binary(
-                mutable_binary=bytearray(b"12345"),
-                proposed_length_change=(-1, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            bytearray(b"2345"),
-        )
-        try:
-            result = normalize_length_of_mutable_binary(
-                mutable_binary=bytearray(b"12345"),
-                proposed_length_change=(0, -1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            bytearray(b"1234"),
-        )
-        try:
-            result = normalize_length_of_mutable_binary(
-                mutable_binary=bytearray(b"12345"),
-                proposed_length_change=(-2, -1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            bytearray(b"34"),
-        )
-
-        try:
-            result = normalize_length_of_mutable_binary(
-                mutable_binary=bytearray(b"12345"),
-                proposed_length_change=(-6, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was sane: {e}",
-            )
-        self.assertEqual(
-            result,
-            bytearray(b""),
-        )
-        try:
-            result = normalize_length_of_mutable_binary(
-                mutable_binary=bytearray(b"12345"),
-                proposed_length_change=(0, -6),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was sane: {e}",
-            )
-        self.assertEqual(
-            result,
-            bytearray(b""),
-        )
+        for (
+            arguments,
+            expected_result,
+        ) in _BINARY_TRUNCATIONS:
+            with self.subTest(**arguments):
+                mutable_binary = bytearray(_BINARY)
+
+                self.assertEqual(
+                    normalize_length_of_mutable_binary(
+                        mutable_binary=mutable_binary,
+                        **arguments,
+                    ),
+                    bytearray(expected_result),
+                )
+                self.assertEqual(
+                    mutable_binary,
+                    bytearray(_BINARY),
+                )
 
     def test_padding(self):
-        try:
-            result = normalize_length_of_mutable_binary(
-                mutable_binary=bytearray(b"12345"),
-                proposed_length_change=(1, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            bytearray(
-                b"".join(
-                    (
-                        b"\0",
-                        b"12345",
-                    )
+        for (
+            arguments,
+            expected_result,
+        ) in _BINARY_PADDINGS:
+            with self.subTest(**arguments):
+                mutable_binary = bytearray(_BINARY)
+
+                self.assertEqual(
+                    normalize_length_of_mutable_binary(
+                        mutable_binary=mutable_binary,
+                        **arguments,
+                    ),
+                    bytearray(expected_result),
                 )
-            ),
-        )
-        try:
-            result = normalize_length_of_mutable_binary(
-                mutable_binary=bytearray(b"12345"),
-                proposed_length_change=(0, 1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            bytearray(
-                b"".join(
-                    (
-                        b"12345",
-                        b"\0",
-                    )
+                self.assertEqual(
+                    mutable_binary,
+                    bytearray(_BINARY),
                 )
+
+    def test_truncation_and_padding(self):
+        for (
+            proposed_length_change,
+            expected_result,
+        ) in (
+            (
+                (2, -1),
+                b"\x00\x001234",
             ),
-        )
-        try:
-            result = normalize_length_of_mutable_binary(
-                mutable_binary=bytearray(b"12345"),
-                proposed_length_change=(1, 2),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            bytearray(
-                b"".join(
-                    (
-                        b"\0",
-                        b"12345",
-                        b"\0",
-                        b"\0",
-                    )
-                )
+            (
+                (-1, 2),
+                b"2345\x00\x00",
             ),
-        )
-
-        try:
-            result = normalize_length_of_mutable_binary(
-                mutable_binary=bytearray(b"12345"),
-                proposed_length_change=(2, 1),
-                padding_value=b"a",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            bytearray(b"aa12345a"),
-        )
-        try:
-            result = normalize_length_of_mutable_binary(
-                mutable_binary=bytearray(b"12345"),
-                proposed_length_change=(3, 4),
-                padding_value=b"ab",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            bytearray(b"aba12345abab"),
-        )
+            (
+                (2, -6),
+                b"\x00",
+            ),
+        ):
+            with self.subTest(proposed_length_change=proposed_length_change):
+                mutable_binary = bytearray(_BINARY)
+
+                self.assertEqual(
+                    normalize_length_of_mutable_binary(
+                        mutable_binary=mutable_binary,
+                        proposed_length_change=proposed_length_change,
+                    ),
+                    bytearray(expected_result),
+                )
+                self.assertEqual(
+                    mutable_binary,
+                    bytearray(_BINARY),
+                )
 
 
 class TestLengthNormalizationOfMutableSequence(unittest.TestCase):
     def test_truncation(self):
-        try:
-            result = normalize_length_of_mutable_sequence(
-                mutable_sequence=[1, 2, 3, 4, 5],
-                proposed_length_change=(-1, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            [2, 3, 4, 5],
-        )
-        try:
-            result = normalize_length_of_mutable_sequence(
-                mutable_sequence=[1, 2, 3, 4, 5],
-                proposed_length_change=(0, -1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            [1, 2, 3, 4],
-        )
-        try:
-            result = normalize_length_of_mutable_sequence(
-                mutable_sequence=[1, 2, 3, 4, 5],
-                proposed_length_change=(-2, -1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            [3, 4],
-        )
-
-        try:
-            result = normalize_length_of_mutable_sequence(
-                mutable_sequence=[1, 2, 3, 4, 5],
-                proposed_length_change=(-6, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was sane: {e}",
-            )
-        self.assertEqual(
-            result,
-            list(),
-        )
-        try:
-            result = normalize_length_of_mutable_sequence(
-                mutable_sequence=[1, 2, 3, 4, 5],
-                proposed_length_change=(0, -6),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was sane: {e}",
-            )
-        self.assertEqual(
-            result,
-            list(),
-        )
+        for (
+            arguments,
+            expected_result,
+        ) in _SEQUENCE_TRUNCATIONS:
+            with self.subTest(**arguments):
+                self.assertEqual(
+                    normalize_length_of_mutable_sequence(
+                        mutable_sequence=list(_SEQUENCE),
+                        **arguments,
+                    ),
+                    list(expected_result),
+                )
 
     def test_padding(self):
-        try:
-            result = normalize_length_of_mutable_sequence(
-                mutable_sequence=[1, 2, 3, 4, 5],
-                proposed_length_change=(1, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            [None, 1, 2, 3, 4, 5],
-        )
-        try:
-            result = normalize_length_of_mutable_sequence(
-                mutable_sequence=[1, 2, 3, 4, 5],
-                proposed_length_change=(0, 1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            [1, 2, 3, 4, 5, None],
-        )
-        try:
-            result = normalize_length_of_mutable_sequence(
-                mutable_sequence=[1, 2, 3, 4, 5],
-                proposed_length_change=(1, 2),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            [None, 1, 2, 3, 4, 5, None, None],
-        )
-        try:
-            result = normalize_length_of_mutable_sequence(
-                mutable_sequence=[1, 2, 3, 4, 5],
-                proposed_length_change=(2, 1),
-                padding_value=(0,),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            [0, 0, 1, 2, 3, 4, 5, 0],
-        )
-
-        try:
-            result = normalize_length_of_mutable_sequence(
-                mutable_sequence=[1, 2, 3, 4, 5],
-                proposed_length_change=(3, 4),
-                padding_value=(-1, -2),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            [-1, -2, -1, 1, 2, 3, 4, 5, -1, -2, -1, -2],
-        )
-        try:
-            result = normalize_length_of_mutable_sequence(
-                mutable_sequence=[1, 2, 3, 4, 5],
-                proposed_length_change=(4, 3),
-                padding_value=("test", 1.2),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertAlmostEqual(
-            result,
-            ["test", 1.2, "test", 1.2, 1, 2, 3, 4, 5, "test", 1.2, "test"],
-        )
+        for (
+            arguments,
+            expected_result,
+        ) in _SEQUENCE_PADDINGS:
+            with self.subTest(**arguments):
+                assert_sequences_almost_equal(
+                    test_case=self,
+                    first=normalize_length_of_mutable_sequence(
+                        mutable_sequence=list(_SEQUENCE),
+                        **arguments,
+                    ),
+                    second=list(expected_result),
+                )
 
 
 class TestLengthNormalizationOfText(unittest.TestCase):
     def test_truncation(self):
-        try:
-            result = normalize_length_of_text(
-                text="12345",
-                proposed_length_change=(-1, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            "2345",
-        )
-        try:
-            result = normalize_length_of_text(
-                text="12345",
-                proposed_length_change=(0, -1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            "1234",
-        )
-        try:
-            result = normalize_length_of_text(
-                text="12345",
-                proposed_length_change=(-2, -1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            "34",
-        )
-
-        try:
-            result = normalize_length_of_text(
-                text="12345",
-                proposed_length_change=(-6, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was sane: {e}",
-            )
-        self.assertEqual(
-            result,
-            "",
-        )
-        try:
-            result = normalize_length_of_text(
-                text="12345",
-                proposed_length_change=(0, -6),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when truncation was sane: {e}",
-            )
-        self.assertEqual(
-            result,
-            "",
-        )
+        for (
+            arguments,
+            expected_result,
+        ) in _TEXT_TRUNCATIONS:
+            with self.subTest(**arguments):
+                self.assertEqual(
+                    normalize_length_of_text(
+                        text=_TEXT,
+                        **arguments,
+                    ),
+                    expected_result,
+                )
 
     def test_padding(self):
-        try:
-            result = normalize_length_of_text(
-                text="12345",
-                proposed_length_change=(1, 0),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            "_12345",
-        )
-        try:
-            result = normalize_length_of_text(
-                text="12345",
-                proposed_length_change=(0, 1),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            "12345_",
-        )
-        try:
-            result = normalize_length_of_text(
-                text="12345",
-                proposed_length_change=(1, 2),
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            "_12345__",
-        )
-
-        try:
-            result = normalize_length_of_text(
-                text="12345",
-                proposed_length_change=(2, 1),
-                padding_value="a",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            "aa12345a",
-        )
-        try:
-            result = normalize_length_of_text(
-                text="12345",
-                proposed_length_change=(3, 4),
-                padding_value="ab",
-            )
-        except Exception as e:
-            self.assert_(
-                False,
-                f"Threw exception when padding was possible: {e}",
-            )
-        self.assertEqual(
-            result,
-            "aba12345abab",
-        )
+        for (
+            arguments,
+            expected_result,
+        ) in _TEXT_PADDINGS:
+            with self.subTest(**arguments):
+                self.assertEqual(
+                    normalize_length_of_text(
+                        text=_TEXT,
+                        **arguments,
+                    ),
+                    expected_result,
+                )
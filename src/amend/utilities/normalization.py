@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import itertools
 import math
+import sys
 from typing import (
     Any,
     Generator,
@@ -28,6 +31,83 @@ from amend.built_in.numbers.integers import amend_integer
 from amend.built_in.mappings.data_mappings import amend_mutable_data_mapping
 
 
+def _resolve_warning_stack_level(
+    warning_stack_level: int,
+) -> int:
+    """Resolves the warning stack level passed to a normalization function.
+
+    Ints of at least 2 are returned as is, and None resolves to the default of 2.
+    Anything else is amended with `amend_integer`, which reports at stack level 4:
+    past itself, this helper and the normalization function calling it, so its
+    warnings point at whatever called that function.
+
+    Parameters
+    ----------
+    warning_stack_level : int
+        Stack level which to report for warnings, as passed by the caller.
+
+    Returns
+    -------
+    int
+        The resolved stack level, at least 2.
+    """
+    if type(warning_stack_level) is int and warning_stack_level >= 2:
+        return warning_stack_level
+    elif warning_stack_level is None:
+        return 2
+
+    return amend_integer(
+        integer=warning_stack_level,
+        value_on_cast_error=2,
+        minimum_value=2,
+        value_violation_action="clamp",
+        warning_stack_level=4,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _find_least_common_multiplier(
+    multiples: Tuple[int, ...],
+) -> int:
+    """Finds the least common multiplier for amended natural number multiples.
+
+    Parameters
+    ----------
+    multiples : Tuple[int, ...]
+        Sorted, distinct natural numbers the result should be a multiple of.
+
+    Returns
+    -------
+    int
+        The least common multiplier of `multiples`.
+    """
+    if len(multiples) == 0:
+        return 1
+    elif sys.version_info >= (3, 9):
+        return math.lcm(*multiples)
+
+    # NOTE: math.lcm is only available since Python 3.9, so this is its fallback.
+    # Dividing before multiplying keeps the intermediate product no larger than
+    # the result. Going from the largest multiple down, smaller multiples that divide
+    # the running result are skipped without computing their gcd.
+    gcd = math.gcd
+    least_common_multiplier = multiples[-1]
+    for element in reversed(multiples[:-1]):
+        if least_common_multiplier % element == 0:
+            continue
+
+        least_common_multiplier = (
+            least_common_multiplier
+            // gcd(
+                least_common_multiplier,
+                element,
+            )
+            * element
+        )
+
+    return least_common_multiplier
+
+
 def find_least_common_multiplier(
     multiples: Iterable[int] = None,
     warning_stack_level: int = None,
@@ -67,35 +147,215 @@ def find_least_common_multiplier(
         multiples = iter(multiples)
     except Exception:
         raise TypeError(f"Multiples {repr(multiples)} isn't iterable")
-    warning_stack_level = amend_integer(
-        integer=warning_stack_level,
-        value_on_cast_error=2,
-        minimum_value=2,
-        value_violation_action="clamp",
-        warning_stack_level=3,
-    )
+    warning_stack_level = _resolve_warning_stack_level(warning_stack_level)
 
-    multiples = tuple(
-        amend_integer(
-            multiple,
+    multiples = tuple(multiples)
+    if not all(type(multiple) is int and multiple >= 1 for multiple in multiples):
+        multiples = tuple(
+            amend_integer(
+                multiple,
+                type_mismatch_action="warning",
+                minimum_value=1,
+                value_violation_action="error",
+                warning_stack_level=warning_stack_level,
+            )
+            for multiple in multiples
+        )
+
+    return _find_least_common_multiplier(tuple(sorted(set(multiples))))
+
+
+def _amend_length_constraints(
+    length: int,
+    minimum_length: int = None,
+    maximum_length: int = None,
+    length_is_multiple_of: Iterable[int] = None,
+    warning_stack_level: int = 2,
+) -> Tuple[
+    int,
+    int,
+    Union[int, None],
+    int,
+]:
+    """Amends length constraints into a form lengths can be searched with.
+
+    Parameters
+    ----------
+    length : int
+        The base length proposition.
+    minimum_length : int
+        The smallest allowed length. Defaults to no lower limit.
+    maximum_length : int
+        The largest allowed length. Defaults to no upper limit.
+    length_is_multiple_of : Iterable[int]
+        Natural numbers length propositions should be a multiple of. Ignores length
+        factorization by default.
+    warning_stack_level : int
+        Stack level which to report for warnings, already amended by the caller.
+        Defaults to 2 (whatever called this).
+
+    Returns
+    -------
+    Tuple[int, int, Union[int, None], int]
+        The amended length, minimum length and maximum length, and the differential
+        (least common multiplier) lengths have to be a multiple of.
+    """
+    length = amend_integer(
+        length,
+        type_mismatch_action="error",
+        minimum_value=0,
+        value_violation_action="error",
+        warning_stack_level=warning_stack_level + 1,
+    )
+    if minimum_length is None:
+        minimum_length = 0
+    else:
+        minimum_length = amend_integer(
+            minimum_length,
+            value_on_cast_error=0,
+            minimum_value=0,
+            value_violation_action="clamp",
+            warning_stack_level=warning_stack_level + 1,
+        )
+    if maximum_length is not None:
+        maximum_length = amend_integer(
+            maximum_length,
             type_mismatch_action="warning",
-            minimum_value=1,
-            value_violation_action="error",
-            warning_stack_level=warning_stack_level,
+            minimum_value=0,
+            value_violation_action="clamp",
+            warning_stack_level=warning_stack_level + 1,
+        )
+
+    if length_is_multiple_of is None:
+        differential = 1
+    else:
+        differential = find_least_common_multiplier(
+            multiples=length_is_multiple_of,
+            warning_stack_level=warning_stack_level + 1,
         )
-        for multiple in multiples
+
+    return (
+        length,
+        minimum_length,
+        maximum_length,
+        differential,
+    )
+
+
+def _find_closest_lengths_satisfying_constraints(
+    length: int,
+    minimum_length: int,
+    maximum_length: Union[int, None],
+    differential: int,
+) -> Tuple[
+    int,
+    int,
+]:
+    """Finds the closest truncated and padded lengths that could satisfy constraints.
+
+    Parameters
+    ----------
+    length : int
+        The amended base length proposition.
+    minimum_length : int
+        The amended smallest allowed length.
+    maximum_length : Union[int, None]
+        The amended largest allowed length, or None if there is no upper limit.
+    differential : int
+        Natural number length propositions should be a multiple of.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The largest truncated length that isn't above `maximum_length`, and the
+        smallest padded length that isn't below `minimum_length`. Either satisfies the
+        constraints only if it's also within the other bound.
+    """
+    # NOTE: Truncated lengths can only exceed the maximum when the padded ones do too,
+    # and padded lengths can only fall short of the minimum when the truncated ones do
+    # too. Starting each side within bounds thus skips candidates without changing the
+    # order of the rest.
+    length_when_truncated = length - length % differential
+    largest_truncated_length = length_when_truncated
+    if maximum_length is not None:
+        largest_truncated_length = min(
+            largest_truncated_length,
+            maximum_length - maximum_length % differential,
+        )
+    smallest_padded_length = max(
+        length_when_truncated + differential,
+        minimum_length + -minimum_length % differential,
+    )
+
+    return (
+        largest_truncated_length,
+        smallest_padded_length,
+    )
+
+
+def _iterate_over_lengths_satisfying_constraints(
+    length: int,
+    minimum_length: int,
+    maximum_length: Union[int, None],
+    differential: int,
+) -> Generator[
+    int,
+    None,
+    None,
+]:
+    """Iterates over all lengths that satisfy amended constraints.
+
+    Parameters
+    ----------
+    length : int
+        The amended base length proposition.
+    minimum_length : int
+        The amended smallest allowed length.
+    maximum_length : Union[int, None]
+        The amended largest allowed length, or None if there is no upper limit.
+    differential : int
+        Natural number length propositions should be a multiple of.
+
+    Yields
+    ------
+    int
+        Length proposal satisfying given constraints.
+    """
+    (
+        largest_truncated_length,
+        smallest_padded_length,
+    ) = _find_closest_lengths_satisfying_constraints(
+        length=length,
+        minimum_length=minimum_length,
+        maximum_length=maximum_length,
+        differential=differential,
     )
-    if len(multiples) == 0:
-        return 1
 
-    least_common_multiplier = multiples[0]
-    for element in multiples[1:]:
-        least_common_multiplier = (least_common_multiplier * element) // math.gcd(
-            least_common_multiplier,
-            element,
+    truncated_lengths = range(
+        largest_truncated_length,
+        minimum_length - 1,
+        -differential,
+    )
+    if maximum_length is None:
+        padded_lengths = itertools.count(
+            smallest_padded_length,
+            differential,
+        )
+    else:
+        padded_lengths = range(
+            smallest_padded_length,
+            maximum_length + 1,
+            differential,
         )
 
-    return least_common_multiplier
+    for truncated_length, padded_length in itertools.zip_longest(
+        truncated_lengths,
+        padded_lengths,
+    ):
+        if truncated_length is not None:
+            yield truncated_length - length
+        if padded_length is not None:
+            yield padded_length - length
 
 
 def iterate_over_lengths_satisfying_constraints(
@@ -125,10 +385,10 @@ def iterate_over_lengths_satisfying_constraints(
     warning_stack_level : int
         Stack level which to report for warnings. Defaults to 2 (whatever called this).
 
-    Yields
-    ------
-    int
-        Length proposal satisfying given constraints.
+    Returns
+    -------
+    Generator[int, None, None]
+        A generator of length proposals satisfying given constraints.
 
     Raises
     ------
@@ -146,74 +406,151 @@ def iterate_over_lengths_satisfying_constraints(
         When any of the following applies:
         - `maximum_length` isn't None and isn't an int
     """
-    warning_stack_level = amend_integer(
-        integer=warning_stack_level,
-        value_on_cast_error=2,
-        minimum_value=2,
-        value_violation_action="clamp",
-        warning_stack_level=3,
-    )
-    length = amend_integer(
+    warning_stack_level = _resolve_warning_stack_level(warning_stack_level)
+    (
         length,
-        type_mismatch_action="error",
-        minimum_value=0,
-        value_violation_action="error",
-        warning_stack_level=warning_stack_level + 1,
-    )
-    minimum_length = amend_integer(
         minimum_length,
-        value_on_cast_error=0,
-        minimum_value=0,
-        value_violation_action="clamp",
+        maximum_length,
+        differential,
+    ) = _amend_length_constraints(
+        length=length,
+        minimum_length=minimum_length,
+        maximum_length=maximum_length,
+        length_is_multiple_of=length_is_multiple_of,
         warning_stack_level=warning_stack_level + 1,
     )
-    if maximum_length is not None:
-        maximum_length = amend_integer(
-            maximum_length,
-            type_mismatch_action="warning",
-            minimum_value=0,
-            value_violation_action="clamp",
-            warning_stack_level=warning_stack_level + 1,
+
+    # NOTE: The generator is returned rather than delegated to, so constraints are
+    # amended, and errors raised, when this is called instead of when it's iterated.
+    return _iterate_over_lengths_satisfying_constraints(
+        length=length,
+        minimum_length=minimum_length,
+        maximum_length=maximum_length,
+        differential=differential,
+    )
+
+
+def _split_length_change_to_left(
+    length_change: int,
+) -> Tuple[int, int]:
+    """Applies the whole length change on the left."""
+    return (
+        length_change,
+        0,
+    )
+
+
+def _split_length_change_to_right(
+    length_change: int,
+) -> Tuple[int, int]:
+    """Applies the whole length change on the right."""
+    return (
+        0,
+        length_change,
+    )
+
+
+def _split_length_change_prioritizing_left(
+    length_change: int,
+) -> Tuple[int, int]:
+    """Splits the length change between sides, giving the odd element to the left."""
+    if length_change > 0:
+        return (
+            (length_change + 1) // 2,
+            length_change // 2,
         )
 
-    if length_is_multiple_of is None:
-        differential = 1
-    else:
-        differential = find_least_common_multiplier(
-            multiples=length_is_multiple_of,
-            warning_stack_level=warning_stack_level + 1,
+    return (
+        length_change // 2,
+        (length_change + 1) // 2,
+    )
+
+
+def _split_length_change_prioritizing_right(
+    length_change: int,
+) -> Tuple[int, int]:
+    """Splits the length change between sides, giving the odd element to the right."""
+    if length_change < 0:
+        return (
+            (length_change + 1) // 2,
+            length_change // 2,
         )
 
-    length_when_truncated = length - (length % differential)
-    length_when_padded = length + differential - (length % differential)
+    return (
+        length_change // 2,
+        (length_change + 1) // 2,
+    )
 
-    new_length_when_truncated = length_when_truncated
-    new_length_when_padded = length_when_padded
 
-    while (
-        length_when_truncated >= minimum_length
-        or maximum_length is None
-        or length_when_padded <= maximum_length
-    ):
-        if length_when_truncated >= minimum_length:
-            if maximum_length is None or length_when_truncated <= maximum_length:
-                yield length_when_truncated - length
-            new_length_when_truncated = length_when_truncated - differential
-
-        if maximum_length is None or length_when_padded <= maximum_length:
-            if length_when_padded >= minimum_length:
-                yield length_when_padded - length
-            new_length_when_padded = length_when_padded + differential
-
-        if (
-            new_length_when_truncated == length_when_truncated
-            and new_length_when_padded == length_when_padded
-        ):
-            break
+_LENGTH_CHANGE_SPLITTERS = {
+    "left": _split_length_change_to_left,
+    "right": _split_length_change_to_right,
+    "both-but-prioritize-left": _split_length_change_prioritizing_left,
+    "both-but-prioritize-right": _split_length_change_prioritizing_right,
+}
+
 
-        length_when_truncated = new_length_when_truncated
-        length_when_padded = new_length_when_padded
-    return
+@functools.lru_cache(maxsize=1024)
+def _determine_length_normalization_strategy(
+    length: int,
+    minimum_length: int,
+    maximum_length: Union[int, None],
+    differential: int,
+    truncation_side: Union[str, None],
+    padding_side: Union[str, None],
+) -> Union[
+    Tuple[int, int],
+    None,
+]:
+    """Determines the length normalization strategy for amended constraints.
+
+    Parameters
+    ----------
+    length : int
+        The amended base length proposition.
+    minimum_length : int
+        The amended smallest allowed length.
+    maximum_length : Union[int, None]
+        The amended largest allowed length, or None if there is no upper limit.
+    differential : int
+        Natural number length propositions should be a multiple of.
+    truncation_side : Union[str, None]
+        A valid truncation side, or None if truncation is disabled.
+    padding_side : Union[str, None]
+        A valid padding side, or None if padding is disabled.
+
+    Returns
+    -------
+    Union[Tuple[int, int], None]
+        A pair of integers showing how many elements on each side need to be added or
+        removed, or None if there is no valid length normalization strategy for the
+        given constraints.
+    """
+    (
+        largest_truncated_length,
+        smallest_padded_length,
+    ) = _find_closest_lengths_satisfying_constraints(
+        length=length,
+        minimum_length=minimum_length,
+        maximum_length=maximum_length,
+        differential=differential,
+    )
+    can_truncate = largest_truncated_length >= minimum_length
+    can_pad = maximum_length is None or smallest_padded_length <= maximum_length
+
+    if can_truncate and largest_truncated_length == length:
+        return (
+            0,
+            0,
+        )
+    elif can_truncate and truncation_side is not None:
+        return _LENGTH_CHANGE_SPLITTERS[truncation_side](
+            largest_truncated_length - length
+        )
+    elif can_pad and padding_side is not None:
+        return _LENGTH_CHANGE_SPLITTERS[padding_side](smallest_padded_length - length)
+
+    return None
 
 
 def determine_length_normalization_strategy(
@@ -302,62 +639,258 @@ def determine_length_normalization_strategy(
         "both-but-prioritize-right",
     ):
         raise ValueError(f"Invalid padding side {repr(padding_side)}")
-    warning_stack_level = amend_integer(
-        integer=warning_stack_level,
-        value_on_cast_error=2,
-        minimum_value=2,
-        value_violation_action="clamp",
-        warning_stack_level=3,
-    )
+    warning_stack_level = _resolve_warning_stack_level(warning_stack_level)
 
-    for proposed_length_change in iterate_over_lengths_satisfying_constraints(
+    (
+        length,
+        minimum_length,
+        maximum_length,
+        differential,
+    ) = _amend_length_constraints(
         length=length,
         minimum_length=minimum_length,
         maximum_length=maximum_length,
         length_is_multiple_of=length_is_multiple_of,
         warning_stack_level=warning_stack_level + 1,
+    )
+
+    if (
+        minimum_length <= length
+        and (maximum_length is None or length <= maximum_length)
+        and length % differential == 0
     ):
-        if proposed_length_change == 0:
-            return (
-                0,
-                0,
-            )
-        elif truncation_side is None and padding_side is None:
-            return None
+        return (
+            0,
+            0,
+        )
 
-        side_to_look_at = (
-            truncation_side if proposed_length_change < 0 else padding_side
+    return _determine_length_normalization_strategy(
+        length=length,
+        minimum_length=minimum_length,
+        maximum_length=maximum_length,
+        differential=differential,
+        truncation_side=truncation_side,
+        padding_side=padding_side,
+    )
+
+
+def _repeat_padding_value(
+    padding_value: Union[
+        bytearray,
+        bytes,
+        List[Any],
+        str,
+        Tuple[Any, ...],
+    ],
+    length: int,
+) -> Union[
+    bytearray,
+    bytes,
+    List[Any],
+    str,
+    Tuple[Any, ...],
+]:
+    """Repeats a padding value until it has exactly the given length.
+
+    Parameters
+    ----------
+    padding_value : Union[bytearray, bytes, List[Any], str, Tuple[Any, ...]]
+        A non-empty padding value.
+    length : int
+        The length of the padding.
+
+    Returns
+    -------
+    Union[bytearray, bytes, List[Any], str, Tuple[Any, ...]]
+        The padding value repeated, and cut off, to `length` elements.
+    """
+    (
+        repetitions,
+        remainder,
+    ) = divmod(
+        length,
+        len(padding_value),
+    )
+    if remainder == 0:
+        return padding_value * repetitions
+
+    return (padding_value * (repetitions + 1))[:length]
+
+
+def _change_length_of_bytearray(
+    data_sequence: bytearray,
+    left_change: int,
+    right_change: int,
+    padding_value: bytearray,
+) -> bytearray:
+    """Changes the length of a bytearray on a copy, padding it on at least one side."""
+    # NOTE: A bytearray is copied once and then changed in place, instead of building
+    # a new one for each side. The copy is made by the left side change, so the bytes
+    # are never shifted afterwards, and the caller's bytearray is left untouched.
+    if left_change < 0:
+        data_sequence = data_sequence[-left_change:]
+    elif left_change > 0:
+        data_sequence = (
+            _repeat_padding_value(
+                padding_value=padding_value,
+                length=left_change,
+            )
+            + data_sequence
         )
-        if side_to_look_at is None:
-            continue
+    else:
+        data_sequence = bytearray(data_sequence)
 
-        if side_to_look_at == "left":
-            return (
-                proposed_length_change,
-                0,
+    if right_change < 0:
+        del data_sequence[right_change:]
+    elif right_change > 0:
+        data_sequence.extend(
+            _repeat_padding_value(
+                padding_value=padding_value,
+                length=right_change,
             )
-        elif side_to_look_at == "right":
-            return (
-                0,
-                proposed_length_change,
+        )
+
+    return data_sequence
+
+
+def _change_length_of_immutable_data_sequence(
+    data_sequence: Union[
+        bytes,
+        str,
+    ],
+    left_change: int,
+    right_change: int,
+    padding_value: Union[
+        bytes,
+        str,
+    ],
+) -> Union[
+    bytes,
+    str,
+]:
+    """Changes the length of bytes or text, padding it on at least one side."""
+    if left_change > 0 and right_change > 0:
+        return data_sequence[:0].join(
+            (
+                _repeat_padding_value(
+                    padding_value=padding_value,
+                    length=left_change,
+                ),
+                data_sequence,
+                _repeat_padding_value(
+                    padding_value=padding_value,
+                    length=right_change,
+                ),
             )
-        elif (
-            side_to_look_at == "both-but-prioritize-left" and proposed_length_change > 0
-        ) or (
-            side_to_look_at == "both-but-prioritize-right"
-            and proposed_length_change < 0
-        ):
-            return (
-                (proposed_length_change + 1) // 2,
-                proposed_length_change // 2,
+        )
+
+    if left_change < 0:
+        data_sequence = data_sequence[-left_change:]
+    elif left_change > 0 and len(padding_value) == 1:
+        data_sequence = data_sequence.rjust(
+            len(data_sequence) + left_change,
+            padding_value,
+        )
+    elif left_change > 0:
+        data_sequence = (
+            _repeat_padding_value(
+                padding_value=padding_value,
+                length=left_change,
             )
+            + data_sequence
+        )
 
-        return (
-            proposed_length_change // 2,
-            (proposed_length_change + 1) // 2,
+    if right_change < 0:
+        data_sequence = data_sequence[:right_change]
+    elif right_change > 0 and len(padding_value) == 1:
+        data_sequence = data_sequence.ljust(
+            len(data_sequence) + right_change,
+            padding_value,
+        )
+    elif right_change > 0:
+        data_sequence = data_sequence + _repeat_padding_value(
+            padding_value=padding_value,
+            length=right_change,
         )
 
-    return None
+    return data_sequence
+
+
+_DATA_SEQUENCE_LENGTH_CHANGERS = {
+    bytearray: _change_length_of_bytearray,
+    bytes: _change_length_of_immutable_data_sequence,
+    str: _change_length_of_immutable_data_sequence,
+}
+
+
+def _apply_length_change_to_data_sequence(
+    data_sequence_type: Union[
+        Type[bytearray],
+        Type[bytes],
+        Type[str],
+    ],
+    data_sequence: Union[
+        bytearray,
+        bytes,
+        str,
+    ],
+    proposed_length_change: Tuple[
+        int,
+        int,
+    ],
+    padding_value: Union[
+        bytearray,
+        bytes,
+        str,
+    ],
+) -> Union[
+    bytearray,
+    bytes,
+    str,
+]:
+    """Applies an already validated length change to a data sequence.
+
+    Parameters
+    ----------
+    data_sequence_type : Union[Type[bytearray], Type[bytes], Type[str]]
+        Type of the data sequence; either a bytearray, bytes or str.
+    data_sequence : Union[bytearray, bytes, str]
+        A data sequence of `data_sequence_type`.
+    proposed_length_change : Tuple[int, int]
+        A pair of integers showing how many elements on each side should be added or
+        removed.
+    padding_value : Union[bytearray, bytes, str]
+        A non-empty value with which to pad, of the same type as the data sequence
+        (bytes for bytes, bytearray for bytearray).
+
+    Returns
+    -------
+    Union[bytearray, bytes, str]
+        The data sequence with normalized length.
+    """
+    (
+        left_change,
+        right_change,
+    ) = proposed_length_change
+
+    if left_change == 0 and right_change == 0:
+        return data_sequence
+    elif left_change <= 0 and right_change <= 0:
+        return data_sequence[-left_change : max(len(data_sequence) + right_change, 0)]
+
+    return _DATA_SEQUENCE_LENGTH_CHANGERS[data_sequence_type](
+        data_sequence=data_sequence,
+        left_change=left_change,
+        right_change=right_change,
+        padding_value=padding_value,
+    )
+
+
+_DEFAULT_PADDING_VALUES = {
+    bytearray: b"\0",
+    bytes: b"\0",
+    str: "_",
+}
 
 
 def _normalize_length_of_data_sequence(
@@ -379,7 +912,7 @@ def _normalize_length_of_data_sequence(
         bytes,
         str,
     ] = None,
-    warning_stack_level: int = None,
+    warning_stack_level: int = 2,
 ) -> Union[
     bytearray,
     bytes,
@@ -401,7 +934,8 @@ def _normalize_length_of_data_sequence(
         automatically repeated to fit the necessary length. By default, pad with the
         null byte or ASCII underscore ('_').
     warning_stack_level : int
-        Stack level which to report for warnings. Defaults to 2 (whatever called this).
+        Stack level which to report for warnings, already amended by the caller.
+        Defaults to 2 (whatever called this).
 
     Returns
     -------
@@ -440,13 +974,6 @@ def _normalize_length_of_data_sequence(
         data_sequence_type,
     ):
         raise TypeError(f"Entity {repr(data_sequence)} isn't {data_sequence_type}")
-    warning_stack_level = amend_integer(
-        integer=warning_stack_level,
-        value_on_cast_error=2,
-        minimum_value=2,
-        value_violation_action="clamp",
-        warning_stack_level=3,
-    )
     if proposed_length_change is None:
         proposed_length_change = (
             0,
@@ -463,6 +990,11 @@ def _normalize_length_of_data_sequence(
         raise ValueError(
             f"Proposed length change has length {len(proposed_length_change)}, not 2"
         )
+    elif (
+        type(proposed_length_change[0]) is int
+        and type(proposed_length_change[1]) is int
+    ):
+        pass
     else:
         proposed_length_change = tuple(
             amend_integer(
@@ -473,16 +1005,10 @@ def _normalize_length_of_data_sequence(
             for length_change in proposed_length_change
         )
     if padding_value is None:
-        if isinstance(
-            data_sequence,
-            (bytearray, bytes),
-        ):
-            padding_value = b"\0"
-        else:
-            padding_value = "_"
-    elif isinstance(
-        data_sequence,
-        (bytearray, bytes),
+        padding_value = _DEFAULT_PADDING_VALUES[data_sequence_type]
+    elif data_sequence_type in (
+        bytearray,
+        bytes,
     ):
         if not isinstance(
             padding_value,
@@ -497,33 +1023,15 @@ def _normalize_length_of_data_sequence(
             f"Padding value {repr(padding_value)} isn't {data_sequence_type}"
         )
 
-    if data_sequence_type == bytearray:
+    if data_sequence_type == bytearray and max(proposed_length_change) > 0:
         padding_value = bytearray(padding_value)
 
-    (
-        left_change,
-        right_change,
-    ) = proposed_length_change
-
-    if left_change < 0:
-        data_sequence = data_sequence[abs(left_change) :]
-    elif left_change > 0:
-        left_padding = (left_change + len(padding_value) - 1) // len(padding_value)
-        left_padding = padding_value * left_padding
-        left_padding = left_padding[:left_change]
-
-        data_sequence = left_padding + data_sequence
-
-    if right_change < 0:
-        data_sequence = data_sequence[:right_change]
-    elif right_change > 0:
-        right_padding = (right_change + len(padding_value) - 1) // len(padding_value)
-        right_padding = padding_value * right_padding
-        right_padding = right_padding[:right_change]
-
-        data_sequence = data_sequence + right_padding
-
-    return data_sequence
+    return _apply_length_change_to_data_sequence(
+        data_sequence_type=data_sequence_type,
+        data_sequence=data_sequence,
+        proposed_length_change=proposed_length_change,
+        padding_value=padding_value,
+    )
 
 
 def normalize_length_of_immutable_binary(
@@ -575,13 +1083,7 @@ def normalize_length_of_immutable_binary(
         When any of the following applies:
         - any element in `proposed_length_change` isn't an int
     """
-    warning_stack_level = amend_integer(
-        integer=warning_stack_level,
-        value_on_cast_error=2,
-        minimum_value=2,
-        value_violation_action="clamp",
-        warning_stack_level=3,
-    )
+    warning_stack_level = _resolve_warning_stack_level(warning_stack_level)
 
     return _normalize_length_of_data_sequence(
         data_sequence_type=bytes,
@@ -641,13 +1143,7 @@ def normalize_length_of_mutable_binary(
         When any of the following applies:
         - any element in `proposed_length_change` isn't an int
     """
-    warning_stack_level = amend_integer(
-        integer=warning_stack_level,
-        value_on_cast_error=2,
-        minimum_value=2,
-        value_violation_action="clamp",
-        warning_stack_level=3,
-    )
+    warning_stack_level = _resolve_warning_stack_level(warning_stack_level)
 
     return _normalize_length_of_data_sequence(
         data_sequence_type=bytearray,
@@ -707,13 +1203,7 @@ def normalize_length_of_text(
         When any of the following applies:
         - any element in `proposed_length_change` isn't an int
     """
-    warning_stack_level = amend_integer(
-        integer=warning_stack_level,
-        value_on_cast_error=2,
-        minimum_value=2,
-        value_violation_action="clamp",
-        warning_stack_level=3,
-    )
+    warning_stack_level = _resolve_warning_stack_level(warning_stack_level)
 
     return _normalize_length_of_data_sequence(
         data_sequence_type=str,
@@ -738,7 +1228,7 @@ def _normalize_length_of_sequence_container(
         int,
     ] = None,
     padding_value: Tuple[Any, ...] = None,
-    warning_stack_level: int = None,
+    warning_stack_level: int = 2,
 ) -> Union[
     List[Any],
     Tuple[Any, ...],
@@ -758,12 +1248,14 @@ def _normalize_length_of_sequence_container(
         Value with which to pad. If value is shorter than the amount to pad it will be
         automatically repeated to fit the necessary length. By default, pad with None.
     warning_stack_level : int
-        Stack level which to report for warnings. Defaults to 2 (whatever called this).
+        Stack level which to report for warnings, already amended by the caller.
+        Defaults to 2 (whatever called this).
 
     Returns
     -------
-    List[Any]
-        The sequence container with normalized length as a list.
+    Union[List[Any], Tuple[Any, ...]]
+        The sequence container with normalized length, as a `sequence_container_type`.
+        Lists are always normalized into a new list.
 
     Raises
     ------
@@ -799,13 +1291,6 @@ def _normalize_length_of_sequence_container(
         raise TypeError(
             f"Entity {repr(sequence_container)} isn't {sequence_container_type}"
         )
-    warning_stack_level = amend_integer(
-        integer=warning_stack_level,
-        value_on_cast_error=2,
-        minimum_value=2,
-        value_violation_action="clamp",
-        warning_stack_level=3,
-    )
     if proposed_length_change is None:
         proposed_length_change = (
             0,
@@ -822,6 +1307,11 @@ def _normalize_length_of_sequence_container(
         raise ValueError(
             f"Proposed length change has length {len(proposed_length_change)}, not 2"
         )
+    elif (
+        type(proposed_length_change[0]) is int
+        and type(proposed_length_change[1]) is int
+    ):
+        pass
     else:
         proposed_length_change = tuple(
             amend_integer(
@@ -832,41 +1322,62 @@ def _normalize_length_of_sequence_container(
             for length_change in proposed_length_change
         )
     if padding_value is None:
-        padding_value = [None]
+        padding_value = (None,)
     elif not isinstance(
         padding_value,
         tuple,
     ):
         raise TypeError(f"Padding value {repr(padding_value)} isn't a tuple")
-    else:
+    if sequence_container_type is list:
         padding_value = list(padding_value)
 
-    sequence_container = list(sequence_container)
-
     (
         left_change,
         right_change,
     ) = proposed_length_change
 
-    if left_change < 0:
-        sequence_container = sequence_container[abs(left_change) :]
-    elif left_change > 0:
-        left_padding = (left_change + len(padding_value) - 1) // len(padding_value)
-        left_padding = padding_value * left_padding
-        left_padding = left_padding[:left_change]
-
-        sequence_container = left_padding + sequence_container
+    if left_change > 0:
+        left_padding = _repeat_padding_value(
+            padding_value=padding_value,
+            length=left_change,
+        )
+    else:
+        left_padding = sequence_container_type()
 
+    start = -left_change if left_change < 0 else 0
+    stop = len(sequence_container)
     if right_change < 0:
-        sequence_container = sequence_container[:right_change]
-    elif right_change > 0:
-        right_padding = (right_change + len(padding_value) - 1) // len(padding_value)
-        right_padding = padding_value * right_padding
-        right_padding = right_padding[:right_change]
+        stop += right_change
+        # NOTE: Changes are applied left first, so truncating more than is left of
+        # the sequence container truncates the left padding as well.
+        if stop < start:
+            left_padding = left_padding[: max(len(left_padding) + stop - start, 0)]
+            stop = start
+
+    if sequence_container_type is tuple:
+        result = left_padding + sequence_container[start:stop]
+        if right_change > 0:
+            result += _repeat_padding_value(
+                padding_value=padding_value,
+                length=right_change,
+            )
 
-        sequence_container = sequence_container + right_padding
+        return result
+    elif left_change <= 0:
+        result = sequence_container[start:stop]
+    else:
+        result = left_padding
+        result.extend(sequence_container[start:stop])
+
+    if right_change > 0:
+        result.extend(
+            _repeat_padding_value(
+                padding_value=padding_value,
+                length=right_change,
+            )
+        )
 
-    return sequence_container
+    return result
 
 
 def normalize_length_of_immutable_sequence(
@@ -917,22 +1428,14 @@ def normalize_length_of_immutable_sequence(
         When any of the following applies:
         - any element in `proposed_length_change` isn't an int
     """
-    warning_stack_level = amend_integer(
-        integer=warning_stack_level,
-        value_on_cast_error=2,
-        minimum_value=2,
-        value_violation_action="clamp",
-        warning_stack_level=3,
-    )
+    warning_stack_level = _resolve_warning_stack_level(warning_stack_level)
 
-    return tuple(
-        _normalize_length_of_sequence_container(
-            sequence_container_type=tuple,
-            sequence_container=immutable_sequence,
-            proposed_length_change=proposed_length_change,
-            padding_value=padding_value,
-            warning_stack_level=warning_stack_level + 1,
-        )
+    return _normalize_length_of_sequence_container(
+        sequence_container_type=tuple,
+        sequence_container=immutable_sequence,
+        proposed_length_change=proposed_length_change,
+        padding_value=padding_value,
+        warning_stack_level=warning_stack_level + 1,
     )
 
 
@@ -984,22 +1487,14 @@ def normalize_length_of_mutable_sequence(
         When any of the following applies:
         - any element in `proposed_length_change` isn't an int
     """
-    warning_stack_level = amend_integer(
-        integer=warning_stack_level,
-        value_on_cast_error=2,
-        minimum_value=2,
-        value_violation_action="clamp",
-        warning_stack_level=3,
-    )
+    warning_stack_level = _resolve_warning_stack_level(warning_stack_level)
 
-    return list(
-        _normalize_length_of_sequence_container(
-            sequence_container_type=list,
-            sequence_container=mutable_sequence,
-            proposed_length_change=proposed_length_change,
-            padding_value=padding_value,
-            warning_stack_level=warning_stack_level + 1,
-        )
+    return _normalize_length_of_sequence_container(
+        sequence_container_type=list,
+        sequence_container=mutable_sequence,
+        proposed_length_change=proposed_length_change,
+        padding_value=padding_value,
+        warning_stack_level=warning_stack_level + 1,
     )
 
 
@@ -1033,20 +1528,10 @@ def get_immutable_mapping(
         When any of the following applies
         - `dict(data_mapping)` throws an Exception
     """
-    warning_stack_level = amend_integer(
-        integer=warning_stack_level,
-        value_on_cast_error=2,
-        minimum_value=2,
-        value_violation_action="clamp",
-        warning_stack_level=3,
-    )
+    warning_stack_level = _resolve_warning_stack_level(warning_stack_level)
     mapping = amend_mutable_data_mapping(
         mutable_data_mapping=mapping,
         warning_stack_level=3,
     )
 
-    mapping = mapping.items()
-    mapping = (tuple(pair) for pair in mapping)
-    mapping = tuple(mapping)
-
-    return mapping
+    return tuple(mapping.items())